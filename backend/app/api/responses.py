@@ -0,0 +1,29 @@
+"""
+Custom response classes for the API layer.
+
+``ORJSONResponse`` in FastAPI calls ``orjson.dumps`` with no options;
+our payloads are dense in ``datetime``/``time`` fields (departure
+boards, live vehicles, journey legs), so we enable orjson's native
+C-level datetime formatting instead of falling back to per-field
+``isoformat()`` calls, and numpy serialisation for array-backed data.
+"""
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class APIJSONResponse(ORJSONResponse):
+    """ORJSON response with datetime/numpy fast paths enabled.
+
+    * ``OPT_NAIVE_UTC``    – treat naive datetimes as UTC;
+    * ``OPT_UTC_Z``        – emit a ``Z`` suffix rather than ``+00:00``;
+    * ``OPT_SERIALIZE_NUMPY`` – encode numpy scalars/arrays natively.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NAIVE_UTC
+            | orjson.OPT_UTC_Z
+            | orjson.OPT_SERIALIZE_NUMPY,
+        )
@@ -5,23 +5,23 @@ FR-DB-01: Show upcoming departures for a stop.
 FR-DB-02: Show real-time expected arrival/departure times.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas import DepartureBoardResponse
-from app.management.data_access import get_db
+from app.management.cache import cached_response, departures_key
+from app.management.data_access import get_read_db
+from app.services import departure_service
 
 router = APIRouter()
 
 
 @router.get("/{stop_id}", response_model=DepartureBoardResponse)
-def get_departures(stop_id: str, db: Session = Depends(get_db)):
+@cached_response(departures_key, ttl_seconds=20)
+async def get_departures(stop_id: str, db: AsyncSession = Depends(get_read_db)):
     """Return upcoming departures for the given stop.
 
     Args:
         stop_id: NaPTAN ATCO code of the stop.
     """
-    # TODO: wire up departure_service.get_departures(stop_id, db)
-    raise NotImplementedError(
-        "Departure board not yet implemented on this branch."
-    )
+    return await departure_service.get_departures(stop_id, db)
@@ -5,22 +5,33 @@ FR-JP-01: Plan a multi-modal journey.
 FR-JP-03: Up to 3 route options (k-shortest-paths).
 """
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas import JourneyRequest, JourneyResponse
-from app.management.data_access import get_db
+from app.management.data_access import get_read_db
+from app.services import journey_service
 
 router = APIRouter()
 
 
 @router.post("", response_model=JourneyResponse)
-def plan_journey(request: JourneyRequest, db: Session = Depends(get_db)):
+async def plan_journey(
+    journey_request: JourneyRequest,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+):
     """Plan a journey between two locations.
 
-    Delegates to the journey service / routing engine.
+    Uses the shared :class:`TransportGraph` built at startup (see
+    ``main.py`` lifespan) – the graph is never rebuilt per request.
+    Queries read it lock-free; mutations (disruption marking, hot-swap)
+    happen under ``app.state.graph_lock`` in the disruption refresh loop
+    and ``journey_service.rebuild_graph``.
     """
-    # TODO: wire up journey_service.plan(request, db)
-    raise NotImplementedError(
-        "Journey planning not yet implemented on this branch."
-    )
+    graph = request.app.state.graph
+    if graph is None:
+        raise HTTPException(
+            status_code=503, detail="Routing data is not loaded yet."
+        )
+    return await journey_service.plan_journey(journey_request, db, graph)
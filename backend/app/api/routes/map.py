@@ -4,18 +4,28 @@ Map state endpoints (Design Doc §6.3 – /api/map).
 FR-LM-03: Combined map state (stops + live vehicles).
 """
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.schemas import MapStateResponse
-from app.management.data_access import get_db
+from app.api.schemas import LiveVehicleOut, MapBounds, MapStateResponse, StopOut
+from app.management.cache import cached_response, map_state_key, snap_bbox_outward
+from app.management.data_access import get_read_db
+from app.services.map_service import get_map_state as fetch_map_state
 
 router = APIRouter()
 
+# Module-level adapters: bulk validate+dump through pydantic-core (Rust)
+# is substantially faster than constructing a MapStateResponse wrapper
+# and letting FastAPI serialise it field by field.
+_stops_adapter = TypeAdapter(list[StopOut])
+_vehicles_adapter = TypeAdapter(list[LiveVehicleOut])
+
 
 @router.get("/state", response_model=MapStateResponse)
-def get_map_state(
-    db: Session = Depends(get_db),
+@cached_response(map_state_key, ttl_seconds=30)  # matches polling_interval_seconds
+async def get_map_state(
+    db: AsyncSession = Depends(get_read_db),
     north: float = Query(54.1),
     south: float = Query(53.7),
     east: float = Query(-2.6),
@@ -24,7 +34,26 @@ def get_map_state(
     """Return stops and live vehicles within the viewport bounds.
 
     Combines data needed for the initial map render and periodic
-    refreshes (FR-LM-03).
+    refreshes (FR-LM-03).  The body is assembled from two bulk
+    ``dump_json`` calls over the raw ORM rows; returning a ``Response``
+    makes FastAPI skip its own (slower) response_model pass, which is
+    kept for OpenAPI docs only.
     """
-    # TODO: wire up map_service.get_state(bounds, db)
-    return MapStateResponse(stops=[], vehicles=[])
+    # Snap outward to the same 0.01° grid as the cache key so repeated
+    # polls reuse the PostGIS query plan as well as the Redis entry
+    # without ever cropping the requested viewport.
+    north, south, east, west = snap_bbox_outward(north, south, east, west)
+    bounds = MapBounds(north=north, south=south, east=east, west=west)
+    stops, vehicles = await fetch_map_state(bounds, db)
+    body = (
+        b'{"stops":'
+        + _stops_adapter.dump_json(
+            _stops_adapter.validate_python(stops, from_attributes=True)
+        )
+        + b',"vehicles":'
+        + _vehicles_adapter.dump_json(
+            _vehicles_adapter.validate_python(vehicles, from_attributes=True)
+        )
+        + b"}"
+    )
+    return Response(content=body, media_type="application/json")
@@ -8,7 +8,7 @@ sensible defaults for local development.
 Environment variables are set per-service in docker-compose.yml.
 """
 
-from functools import lru_cache
+from typing import Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -29,10 +29,18 @@ class Settings(BaseSettings):
 
     # ── Database (PostgreSQL + PostGIS) ──────────────────────────────────
     database_url: str = (
-        "postgresql+psycopg2://lancasterlink:lancasterlink"
+        "postgresql+asyncpg://lancasterlink:lancasterlink"
         "@localhost:5432/lancasterlink"
     )
 
+    # Connection-pool tuning.  The /api/live and /api/map endpoints are
+    # polled every 30 s by every connected client (DR-03), so bursts well
+    # beyond SQLAlchemy's default pool_size=5 are expected.
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 3600         # Drop connections older than 1 h
+    db_pool_pre_ping: bool = True       # Detect stale connections cheaply
+
     # ── Redis ────────────────────────────────────────────────────────────
     redis_url: str = "redis://localhost:6379/0"
 
@@ -52,7 +60,15 @@ class Settings(BaseSettings):
     app_version: str = "0.1.0"
 
 
-@lru_cache
+# Lazily constructed module-level singleton.  A plain attribute read is
+# cheaper than lru_cache dispatch (hash + lock) for a function that is
+# called from request-path dependencies.
+_settings: Optional[Settings] = None
+
+
 def get_settings() -> Settings:
-    """Return a cached singleton of the application settings."""
-    return Settings()
+    """Return the application settings singleton."""
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
@@ -2,21 +2,40 @@
 Disruption handler – checks active disruptions and adjusts journey
 plans accordingly.
 
+Disruptions change on the minute scale, not per request, so the active
+set is cached: a background task (started from the FastAPI lifespan)
+refreshes a process-local frozenset every ``polling_interval_seconds``.
+Each refresh reads the Redis mirror (``disruptions:active``) first and
+only falls back to the database when the mirror has expired, so across
+workers a single DB query per TTL window serves everyone.  Request-path
+checks (``is_route_disrupted``, feeding
+``TransportGraph.mark_disrupted``) never touch the database.
+
 Requirements:
     FR-JP-05: Flag disrupted routes and suggest alternatives.
 """
 
+import asyncio
+import json
 import logging
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+# Redis key holding the mirrored active-disruption route IDs.
+DISRUPTIONS_KEY = "disruptions:active"
+
+# Process-local cache of route IDs with an active disruption.  Replaced
+# wholesale on each refresh so readers never see a partial update.
+_cached_disrupted_routes: frozenset[int] = frozenset()
 
-def get_active_disruptions(
-    db: Session,
+
+async def get_active_disruptions(
+    db: AsyncSession,
     route_id: Optional[int] = None,
     stop_atco: Optional[str] = None,
     at_time: Optional[datetime] = None,
@@ -24,7 +43,7 @@ def get_active_disruptions(
     """Fetch currently active disruptions, optionally filtered.
 
     Args:
-        db: Database session.
+        db: Async database session.
         route_id: Filter by route (optional).
         stop_atco: Filter by stop (optional).
         at_time: Point in time to check (defaults to now).
@@ -32,12 +51,126 @@ def get_active_disruptions(
     Returns:
         List of Disruption ORM objects.
     """
-    # TODO: query disruptions table with time/route/stop filters
-    logger.info("Checking disruptions route=%s stop=%s", route_id, stop_atco)
-    return []
+    from app.models.disruption import Disruption
+
+    when = at_time or datetime.now()
+    query = select(Disruption).where(
+        Disruption.starts_at <= when,
+        or_(Disruption.ends_at.is_(None), Disruption.ends_at >= when),
+    )
+    if route_id is not None:
+        query = query.where(Disruption.route_id == route_id)
+    if stop_atco is not None:
+        query = query.where(Disruption.stop_atco_code == stop_atco)
+
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+def is_route_disrupted(route_id: int) -> bool:
+    """O(1) check against the cached active-disruption set.
+
+    Served entirely from the process-local cache maintained by
+    :func:`refresh_disruptions_loop` – no database round-trip.
+    """
+    return route_id in _cached_disrupted_routes
+
+
+def active_disrupted_route_ids() -> frozenset[int]:
+    """Expose the cached set directly (e.g. for
+    ``TransportGraph.mark_disrupted``)."""
+    return _cached_disrupted_routes
+
+
+async def apply_disruptions_to_graph(application) -> None:
+    """Mark the cached disruption set on the shared graph.
+
+    This is the only place (besides the hot-swap in
+    ``journey_service.rebuild_graph``) that mutates the shared graph, and
+    it runs under ``app.state.graph_lock`` – journey requests read the
+    graph lock-free.
+    """
+    async with application.state.graph_lock:
+        graph = application.state.graph
+        if graph is None:
+            return
+        graph.clear_disruptions()
+        if _cached_disrupted_routes:
+            graph.mark_disrupted(_cached_disrupted_routes)
+
+
+async def refresh_active_disruptions(
+    ttl_seconds: int = 60, application=None
+) -> frozenset[int]:
+    """Refresh the active-disruption set via the Redis mirror or the DB.
+
+    The mirror is read before the database: another worker may have
+    refreshed within the TTL, so only one worker per TTL window pays
+    the disruption query.  On a mirror miss (or with Redis down) the
+    set is reloaded from the DB and mirrored back.  When the set
+    changed and ``application`` is given, the new set is applied to the
+    shared graph under the graph lock.  Returns the refreshed set;
+    Redis failures are logged and tolerated (the process-local cache
+    still updates from the DB).
+    """
+    global _cached_disrupted_routes
+    from app.management.cache import get_redis
+    from app.management.data_access import sessionmanager
+
+    route_ids: frozenset[int] | None = None
+    try:
+        mirrored = await get_redis().get(DISRUPTIONS_KEY)
+        if mirrored is not None:
+            route_ids = frozenset(json.loads(mirrored))
+    except Exception:  # pragma: no cover - Redis down is non-fatal
+        logger.warning(
+            "Could not read disruption mirror from Redis", exc_info=True
+        )
 
+    if route_ids is None:
+        async with sessionmanager.session() as db:
+            disruptions = await get_active_disruptions(db)
+        route_ids = frozenset(
+            d.route_id for d in disruptions if d.route_id is not None
+        )
+        try:
+            await get_redis().set(
+                DISRUPTIONS_KEY, json.dumps(sorted(route_ids)), ex=ttl_seconds
+            )
+        except Exception:  # pragma: no cover - Redis down is non-fatal
+            logger.warning(
+                "Could not mirror disruption set to Redis", exc_info=True
+            )
 
-def is_route_disrupted(route_id: int, db: Session) -> bool:
-    """Quick check whether a route has any active disruptions."""
-    disruptions = get_active_disruptions(db, route_id=route_id)
-    return len(disruptions) > 0
+    if route_ids != _cached_disrupted_routes:
+        # Plans computed under the old disruption set are invalid.
+        from app.logic.routing.router import clear_journey_cache
+
+        clear_journey_cache()
+        _cached_disrupted_routes = route_ids
+        if application is not None:
+            await apply_disruptions_to_graph(application)
+    else:
+        _cached_disrupted_routes = route_ids
+
+    return route_ids
+
+
+async def refresh_disruptions_loop(interval: int = 30, application=None) -> None:
+    """Background task: refresh the disruption cache every ``interval`` s.
+
+    Started from the FastAPI lifespan handler; cancelled on shutdown.
+    The Redis TTL is 2×interval so a stalled worker's stale entry
+    expires rather than lingering.
+    """
+    while True:
+        try:
+            route_ids = await refresh_active_disruptions(
+                ttl_seconds=interval * 2, application=application
+            )
+            logger.debug("Disruption cache refreshed: %d routes", len(route_ids))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Disruption refresh failed; retrying next cycle")
+        await asyncio.sleep(interval)
@@ -0,0 +1,307 @@
+"""
+Numba-compiled Dijkstra kernel over the graph's SoA arrays.
+
+The router's node-expansion loop is a tight numeric loop: seek the first
+catchable departure, compute wait + travel (+ per-stop reliability
+adjustment), compare against the best known cost, push.  Interpreted
+over edge objects this costs microseconds per relaxation; compiled over
+the typed arrays from ``TransportGraph.finalise()`` it runs at native
+speed.
+
+The priority queue is a Dial bucket queue rather than a binary heap:
+costs are minutes bounded by ``_MAX_COST_MIN``, so quantising them to
+0.1-minute ticks gives O(1) push/pop against a bucket ring instead of
+O(log n) sift operations, and the extract cursor only ever moves
+forward because edge costs are non-negative.  Entries are chained
+through a preallocated pool (``ent_next``) so pushes never allocate.
+
+Numba is an optional dependency: when it is not importable the module
+exposes ``HAVE_NUMBA = False`` and the router falls back to the pure-
+Python search, which implements the identical cost model.
+
+Edge encoding in the parent arrays: ``parent_edge[v] >= 0`` is a flat
+transit-edge index; ``parent_edge[v] <= -2`` encodes walking edge
+``-(parent_edge[v]) - 2``; ``-1`` means unreached/origin.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+# Dial bucket-queue parameters: costs are quantised to 0.1-minute ticks
+# (walk costs and hub adjustments are fractional) and capped at two
+# days' worth of minutes – any path costlier than that lands in the last
+# bucket, which only degrades ordering for journeys no one would take.
+_TICKS_PER_MIN = 10
+_MAX_COST_MIN = 2880
+_N_BUCKETS = _MAX_COST_MIN * _TICKS_PER_MIN + 1
+
+# The per-arrival hub bonus can make the geographic A* potential
+# over-estimate by up to HUB_MAX_BONUS_MINS per transit leg, so after
+# first reaching the destination the search drains this many further
+# minutes of buckets before declaring the best journey final (30 min =
+# ten legs' worth of bonus, far beyond any plausible plan).
+_ASTAR_SLACK_MIN = 30.0
+
+
+@njit(cache=True)
+def dijkstra_core(
+    edge_offsets,
+    edge_dep_min,
+    edge_travel_min,
+    edge_to_idx,
+    walk_offsets,
+    walk_to_idx,
+    walk_minutes,
+    stop_adjust,
+    stop_potential,
+    edge_excluded,
+    start_idx,
+    dest_idx,
+    start_min,
+    walk_cost_factor,
+    max_expansions,
+    cost_upper_bound,
+):
+    """Single-source time-dependent A*/Dijkstra over the SoA graph.
+
+    ``stop_potential`` is an admissible per-stop lower bound to the
+    destination (geographic potential; pass zeros for plain Dijkstra);
+    bucket priorities are ``cost + potential`` so expansion focuses on
+    the corridor toward the destination.  ``cost_upper_bound`` (pass
+    np.inf to disable) caps the explored cost range – alternative-route
+    re-runs prune against the first journey's cost.
+
+    Returns ``(best_cost, arrival_min, parent_node, parent_edge)`` per
+    stop index; the search stops once the destination is final or
+    ``max_expansions`` nodes have been expanded.
+    """
+    n_stops = stop_adjust.shape[0]
+    inf = np.inf
+
+    best_cost = np.full(n_stops, inf, dtype=np.float64)
+    arrival = np.full(n_stops, -1, dtype=np.int64)
+    parent_node = np.full(n_stops, -1, dtype=np.int32)
+    parent_edge = np.full(n_stops, -1, dtype=np.int64)
+
+    # Dial bucket queue: head[b] chains entries of quantised cost b
+    # through ent_next; pushes are O(1) appends to a growable pool.
+    head = np.full(_N_BUCKETS, -1, dtype=np.int64)
+    capacity = 1024
+    ent_cost = np.empty(capacity, dtype=np.float64)
+    ent_node = np.empty(capacity, dtype=np.int32)
+    ent_arr = np.empty(capacity, dtype=np.int64)
+    ent_next = np.empty(capacity, dtype=np.int64)
+    n_entries = 0
+
+    best_cost[start_idx] = 0.0
+    arrival[start_idx] = start_min
+    ent_cost[0] = 0.0
+    ent_node[0] = start_idx
+    ent_arr[0] = start_min
+    ent_next[0] = -1
+    start_bucket = int(stop_potential[start_idx] * _TICKS_PER_MIN + 0.5)
+    if start_bucket >= _N_BUCKETS:
+        start_bucket = _N_BUCKETS - 1
+    head[start_bucket] = 0
+    n_entries = 1
+
+    cursor = start_bucket
+    expansions = 0
+    # Once the destination is reached, keep draining buckets for the
+    # A* slack window in case the potential over-estimated (see
+    # _ASTAR_SLACK_MIN); stop_bucket is exclusive.
+    stop_bucket = _N_BUCKETS
+    if cost_upper_bound < _MAX_COST_MIN:
+        limit = (cost_upper_bound + _ASTAR_SLACK_MIN) * _TICKS_PER_MIN
+        stop_bucket = int(limit) + 1
+    while cursor < stop_bucket and expansions < max_expansions:
+        idx = head[cursor]
+        if idx < 0:
+            cursor += 1
+            continue
+        head[cursor] = ent_next[idx]
+        cost = ent_cost[idx]
+        node = ent_node[idx]
+        arr = ent_arr[idx]
+        if cost > best_cost[node]:
+            continue  # stale lazy-deletion entry
+        if node == dest_idx:
+            limit = (best_cost[dest_idx] + _ASTAR_SLACK_MIN) * _TICKS_PER_MIN
+            if limit < stop_bucket:
+                stop_bucket = int(limit) + 1
+            continue
+        expansions += 1
+
+        # Transit edges: binary-seek the first catchable departure.
+        start = edge_offsets[node]
+        end = edge_offsets[node + 1]
+        if start < end and arr <= 1439:
+            lo = start + np.searchsorted(edge_dep_min[start:end], arr)
+            for j in range(lo, end):
+                if edge_excluded[j]:
+                    continue
+                to = edge_to_idx[j]
+                wait = edge_dep_min[j] - arr
+                travel = edge_travel_min[j] + stop_adjust[to]
+                if travel < 0.0:
+                    travel = 0.0
+                new_cost = cost + wait + travel
+                if new_cost < best_cost[to]:
+                    best_cost[to] = new_cost
+                    arrival[to] = edge_dep_min[j] + edge_travel_min[j]
+                    parent_node[to] = node
+                    parent_edge[to] = j
+                    if n_entries == ent_cost.shape[0]:
+                        ent_cost = np.concatenate((ent_cost, ent_cost))
+                        ent_node = np.concatenate((ent_node, ent_node))
+                        ent_arr = np.concatenate((ent_arr, ent_arr))
+                        ent_next = np.concatenate((ent_next, ent_next))
+                    bucket = int(
+                        (new_cost + stop_potential[to]) * _TICKS_PER_MIN + 0.5
+                    )
+                    if bucket < cursor:
+                        bucket = cursor  # never behind the cursor
+                    elif bucket >= _N_BUCKETS:
+                        bucket = _N_BUCKETS - 1
+                    ent_cost[n_entries] = new_cost
+                    ent_node[n_entries] = to
+                    ent_arr[n_entries] = arrival[to]
+                    ent_next[n_entries] = head[bucket]
+                    head[bucket] = n_entries
+                    n_entries += 1
+
+        # Walking edges: usable at any time of day.
+        wstart = walk_offsets[node]
+        wend = walk_offsets[node + 1]
+        for k in range(wstart, wend):
+            to = walk_to_idx[k]
+            new_cost = cost + walk_minutes[k] * walk_cost_factor
+            if new_cost < best_cost[to]:
+                best_cost[to] = new_cost
+                arrival[to] = arr + int(np.ceil(walk_minutes[k]))
+                parent_node[to] = node
+                parent_edge[to] = -k - 2
+                if n_entries == ent_cost.shape[0]:
+                    ent_cost = np.concatenate((ent_cost, ent_cost))
+                    ent_node = np.concatenate((ent_node, ent_node))
+                    ent_arr = np.concatenate((ent_arr, ent_arr))
+                    ent_next = np.concatenate((ent_next, ent_next))
+                bucket = int(
+                    (new_cost + stop_potential[to]) * _TICKS_PER_MIN + 0.5
+                )
+                if bucket < cursor:
+                    bucket = cursor  # never behind the cursor
+                elif bucket >= _N_BUCKETS:
+                    bucket = _N_BUCKETS - 1
+                ent_cost[n_entries] = new_cost
+                ent_node[n_entries] = to
+                ent_arr[n_entries] = arrival[to]
+                ent_next[n_entries] = head[bucket]
+                head[bucket] = n_entries
+                n_entries += 1
+
+    return best_cost, arrival, parent_node, parent_edge
+
+
+@njit(cache=True)
+def lower_bounds_core(
+    rev_offsets,
+    rev_from_idx,
+    rev_travel_min,
+    walk_offsets,
+    walk_to_idx,
+    walk_minutes,
+    dest_idx,
+    hub_bonus_max,
+    walk_cost_factor,
+):
+    """Backward static Dijkstra: minutes lower bound per stop to
+    ``dest_idx`` (see router._backward_lower_bounds for the model).
+
+    Uses the same quantised bucket queue as the forward kernel; static
+    weights are plain Dijkstra-monotone so no slack window is needed.
+    """
+    n_stops = rev_offsets.shape[0] - 1
+    dist = np.full(n_stops, np.inf, dtype=np.float64)
+    dist[dest_idx] = 0.0
+
+    head = np.full(_N_BUCKETS, -1, dtype=np.int64)
+    capacity = 1024
+    ent_cost = np.empty(capacity, dtype=np.float64)
+    ent_node = np.empty(capacity, dtype=np.int32)
+    ent_next = np.empty(capacity, dtype=np.int64)
+    ent_cost[0] = 0.0
+    ent_node[0] = dest_idx
+    ent_next[0] = -1
+    head[0] = 0
+    n_entries = 1
+
+    cursor = 0
+    while cursor < _N_BUCKETS:
+        idx = head[cursor]
+        if idx < 0:
+            cursor += 1
+            continue
+        head[cursor] = ent_next[idx]
+        d = ent_cost[idx]
+        node = ent_node[idx]
+        if d > dist[node]:
+            continue
+
+        for j in range(rev_offsets[node], rev_offsets[node + 1]):
+            src = rev_from_idx[j]
+            w = rev_travel_min[j] - hub_bonus_max
+            if w < 0.0:
+                w = 0.0
+            nd = d + w
+            if nd < dist[src]:
+                dist[src] = nd
+                if n_entries == ent_cost.shape[0]:
+                    ent_cost = np.concatenate((ent_cost, ent_cost))
+                    ent_node = np.concatenate((ent_node, ent_node))
+                    ent_next = np.concatenate((ent_next, ent_next))
+                bucket = int(nd * _TICKS_PER_MIN + 0.5)
+                if bucket < cursor:
+                    bucket = cursor
+                elif bucket >= _N_BUCKETS:
+                    bucket = _N_BUCKETS - 1
+                ent_cost[n_entries] = nd
+                ent_node[n_entries] = src
+                ent_next[n_entries] = head[bucket]
+                head[bucket] = n_entries
+                n_entries += 1
+
+        for k in range(walk_offsets[node], walk_offsets[node + 1]):
+            src = walk_to_idx[k]
+            nd = d + walk_minutes[k] * walk_cost_factor
+            if nd < dist[src]:
+                dist[src] = nd
+                if n_entries == ent_cost.shape[0]:
+                    ent_cost = np.concatenate((ent_cost, ent_cost))
+                    ent_node = np.concatenate((ent_node, ent_node))
+                    ent_next = np.concatenate((ent_next, ent_next))
+                bucket = int(nd * _TICKS_PER_MIN + 0.5)
+                if bucket < cursor:
+                    bucket = cursor
+                elif bucket >= _N_BUCKETS:
+                    bucket = _N_BUCKETS - 1
+                ent_cost[n_entries] = nd
+                ent_node[n_entries] = src
+                ent_next[n_entries] = head[bucket]
+                head[bucket] = n_entries
+                n_entries += 1
+
+    return dist
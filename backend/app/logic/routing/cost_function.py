@@ -0,0 +1,12 @@
+"""
+Shared cost constants for the time-dependent router.
+
+Edge costs (wait + travel, plus the reliability adjustments from
+``heuristics.py``) are evaluated inside the vectorised relaxation loops
+in ``router.py`` – over whole edge ranges at once, not per edge – so
+only the constants both search engines share live here.
+"""
+
+# Walking is penalised slightly beyond its nominal duration so the
+# planner prefers staying on a vehicle over marginal walk-and-change.
+WALK_COST_FACTOR = 1.2
@@ -0,0 +1,485 @@
+"""
+Transport graph construction for the journey planner (Design Doc §5.1).
+
+Builds an in-memory, time-dependent graph from timetable data:
+
+    * Nodes   – stops/stations, keyed by ATCO code.
+    * Edges   – ``TransitEdge`` (a scheduled hop between consecutive stops
+                of one trip) and ``WalkingEdge`` (an interchange on foot).
+
+The graph is queried by the router (``router.py``) via
+``get_outgoing_transit_edges`` / ``get_walking_edges``; the cost of
+traversing an edge is computed in the router's relaxation loops.
+
+Performance note: all hot-path time values are packed integer minutes
+since midnight (0..1439), converted from ``datetime.time`` exactly once
+per edge at build time.  The router compares and subtracts these as
+plain ints; ``datetime.time`` objects survive on the edges only for
+reconstruction/serialisation at the end of a search.  ``travel_minutes``
+is likewise computed once at build time rather than re-derived per
+relaxation.
+"""
+
+import logging
+import sys
+from dataclasses import dataclass
+from itertools import groupby
+from datetime import time
+from typing import ClassVar, Iterable, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _to_minutes(t: time) -> int:
+    """Pack a ``datetime.time`` into integer minutes since midnight."""
+    return t.hour * 60 + t.minute
+
+
+# ── Edge types ───────────────────────────────────────────────────────────
+
+# Edge kind tags: an int compare in the router's hot loops where an
+# isinstance() check would walk the MRO per edge.
+KIND_TRANSIT = 0
+KIND_WALK = 1
+
+
+@dataclass(slots=True, frozen=True)
+class TransitEdge:
+    """A scheduled hop between two consecutive stops of one trip.
+
+    Immutable and slotted: a city-scale timetable produces hundreds of
+    thousands of these, so dropping the per-instance ``__dict__`` saves
+    real memory and keeps attribute loads on the C slot-descriptor path.
+    """
+
+    from_stop: str              # ATCO code
+    to_stop: str                # ATCO code
+    route_id: int
+    departure_time: time        # departure from from_stop (display only)
+    arrival_time: time          # arrival at to_stop (display only)
+    departure_min: int          # packed minutes since midnight (hot path)
+    arrival_min: int            # packed minutes since midnight (hot path)
+    travel_minutes: float       # precomputed at build time (see module docs)
+
+    kind: ClassVar[int] = KIND_TRANSIT
+
+
+@dataclass(slots=True, frozen=True)
+class WalkingEdge:
+    """A walkable interchange between two nearby stops."""
+
+    from_stop: str
+    to_stop: str
+    walk_time_mins: float
+    distance_metres: float
+
+    kind: ClassVar[int] = KIND_WALK
+
+
+# ── Graph ────────────────────────────────────────────────────────────────
+
+class TransportGraph:
+    """Time-dependent multi-modal transport graph.
+
+    Stops are added first, then transit/walking edges; ``finalise()``
+    must be called before querying so per-stop edge lists are sorted by
+    departure time.
+    """
+
+    def __init__(self) -> None:
+        self._stops: dict[str, object] = {}
+        self._routes: dict[int, object] = {}
+        self._transit_edges: dict[str, list[TransitEdge]] = {}
+        # Walking connections are symmetric, so each is stored once;
+        # _walking_incident maps both endpoints to the shared index and
+        # reversed views are materialised lazily on first use.
+        self._walking_unique: list[WalkingEdge] = []
+        self._walking_reversed: list[Optional[WalkingEdge]] = []
+        self._walking_incident: dict[str, list[int]] = {}
+        self._disrupted_route_ids: set[int] = set()
+        # Bitset over route IDs mirroring _disrupted_route_ids: a numpy
+        # bool load per edge beats a set hash lookup in the filter loop,
+        # and whole CSR slices can be masked in one vectorised index.
+        self._disrupted_mask = np.zeros(0, dtype=np.bool_)
+        self._finalised = False
+
+        # Structure-of-Arrays edge storage, built by finalise().  Stops
+        # get dense integer IDs; all outgoing transit edges are packed
+        # into flat CSR-style arrays so queries are a searchsorted over a
+        # contiguous uint16 slice and the future search kernel can run
+        # over typed arrays instead of chasing object pointers.
+        self.stop_id: dict[str, int] = {}
+        self.id_to_atco: list[str] = []
+        self.edge_offsets = np.zeros(1, dtype=np.int64)   # CSR offsets
+        self.edge_dep_min = np.zeros(0, dtype=np.uint16)
+        self.edge_travel_min = np.zeros(0, dtype=np.uint16)
+        self.edge_to_idx = np.zeros(0, dtype=np.int32)
+        self.edge_route_id = np.zeros(0, dtype=np.int32)
+        self._edges_flat: list[TransitEdge] = []
+        # Walking edges in the same CSR layout, plus per-stop hub scores
+        # for the reliability adjustment used by the search kernel.
+        self.walk_offsets = np.zeros(1, dtype=np.int64)
+        self.walk_to_idx = np.zeros(0, dtype=np.int32)
+        self.walk_minutes = np.zeros(0, dtype=np.float64)
+        self._walks_flat: list[WalkingEdge] = []
+        self.stop_hub_score = np.zeros(0, dtype=np.float64)
+        self.hub_score_max = 1.0
+        # Reverse static adjacency: minimum travel minutes per distinct
+        # (from, to) stop pair, CSR-indexed by destination stop.  The
+        # router's backward lower-bound search runs over this.
+        self.rev_offsets = np.zeros(1, dtype=np.int64)
+        self.rev_from_idx = np.zeros(0, dtype=np.int32)
+        self.rev_travel_min = np.zeros(0, dtype=np.float64)
+        self.stop_lat_rad = np.zeros(0, dtype=np.float64)
+        self.stop_lon_rad = np.zeros(0, dtype=np.float64)
+
+    # ── Construction ────────────────────────────────────────────────
+
+    def add_stop(self, stop) -> None:
+        """Register a stop (any object exposing ``atco_code``)."""
+        self._stops[sys.intern(stop.atco_code)] = stop
+
+    def add_route(self, route) -> None:
+        """Register a route (any object exposing ``route_id``)."""
+        self._routes[route.route_id] = route
+
+    def add_transit_edge(self, edge: TransitEdge) -> None:
+        self._transit_edges.setdefault(sys.intern(edge.from_stop), []).append(edge)
+        self._finalised = False
+
+    def add_walking_connection(
+        self,
+        from_atco: str,
+        to_atco: str,
+        walk_time_mins: float,
+        distance_metres: float,
+    ) -> None:
+        """Register a symmetric walking connection (stored once)."""
+        from_atco = sys.intern(from_atco)
+        to_atco = sys.intern(to_atco)
+        idx = len(self._walking_unique)
+        self._walking_unique.append(
+            WalkingEdge(from_atco, to_atco, walk_time_mins, distance_metres)
+        )
+        self._walking_reversed.append(None)
+        self._walking_incident.setdefault(from_atco, []).append(idx)
+        self._walking_incident.setdefault(to_atco, []).append(idx)
+
+    def _walking_view(self, idx: int, from_atco: str) -> WalkingEdge:
+        """Direction-correct view of walking connection ``idx``."""
+        edge = self._walking_unique[idx]
+        if edge.from_stop == from_atco:
+            return edge
+        reverse = self._walking_reversed[idx]
+        if reverse is None:
+            reverse = WalkingEdge(
+                edge.to_stop,
+                edge.from_stop,
+                edge.walk_time_mins,
+                edge.distance_metres,
+            )
+            self._walking_reversed[idx] = reverse
+        return reverse
+
+    def finalise(self) -> None:
+        """Assign dense stop IDs and pack edges into SoA arrays.
+
+        Per-stop edge lists are sorted by departure time, then
+        concatenated (in stop-ID order) into flat parallel arrays with a
+        CSR offset table.  ``_edges_flat`` keeps the edge objects in the
+        same order so array hits can be materialised back into
+        :class:`TransitEdge` for reconstruction.
+        """
+        codes = list(self._stops.keys())
+        seen = set(codes)
+        # Edges may reference stops missing from the stop table (e.g. a
+        # timetable row pointing outside the loaded area); give them IDs
+        # anyway so the arrays stay consistent.
+        for edges in self._transit_edges.values():
+            for edge in edges:
+                if edge.to_stop not in seen:
+                    seen.add(edge.to_stop)
+                    codes.append(edge.to_stop)
+        for wedge in self._walking_unique:
+            for endpoint in (wedge.from_stop, wedge.to_stop):
+                if endpoint not in seen:
+                    seen.add(endpoint)
+                    codes.append(endpoint)
+
+        # Interned keys make the per-relaxation dict lookups in the
+        # pure-Python search effectively pointer comparisons (the dense
+        # int IDs below are what the SoA arrays and kernel use).
+        codes = [sys.intern(code) for code in codes]
+        self.stop_id = {code: i for i, code in enumerate(codes)}
+        self.id_to_atco = codes
+
+        n_stops = len(codes)
+        offsets = np.zeros(n_stops + 1, dtype=np.int64)
+        dep_min: list[int] = []
+        travel_min: list[int] = []
+        to_idx: list[int] = []
+        route_ids: list[int] = []
+        self._edges_flat = []
+
+        for i, code in enumerate(codes):
+            edges = self._transit_edges.get(code, [])
+            edges.sort(key=lambda e: e.departure_min)
+            for edge in edges:
+                dep_min.append(edge.departure_min)
+                travel_min.append(int(edge.travel_minutes))
+                to_idx.append(self.stop_id[edge.to_stop])
+                route_ids.append(edge.route_id)
+                self._edges_flat.append(edge)
+            offsets[i + 1] = len(self._edges_flat)
+
+        self.edge_offsets = offsets
+        self.edge_dep_min = np.asarray(dep_min, dtype=np.uint16)
+        self.edge_travel_min = np.asarray(travel_min, dtype=np.uint16)
+        self.edge_to_idx = np.asarray(to_idx, dtype=np.int32)
+        self.edge_route_id = np.asarray(route_ids, dtype=np.int32)
+
+        # Walking edges, same CSR layout.
+        walk_offsets = np.zeros(n_stops + 1, dtype=np.int64)
+        walk_to: list[int] = []
+        walk_mins: list[float] = []
+        self._walks_flat = []
+        for i, code in enumerate(codes):
+            for idx in self._walking_incident.get(code, []):
+                view = self._walking_view(idx, code)
+                walk_to.append(self.stop_id[view.to_stop])
+                walk_mins.append(view.walk_time_mins)
+                self._walks_flat.append(view)
+            walk_offsets[i + 1] = len(self._walks_flat)
+        self.walk_offsets = walk_offsets
+        self.walk_to_idx = np.asarray(walk_to, dtype=np.int32)
+        self.walk_minutes = np.asarray(walk_mins, dtype=np.float64)
+
+        # Reverse static adjacency: collapse the timetable to one
+        # minimum-travel-minutes edge per distinct (from, to) pair and
+        # index it by the *destination* stop, so a backward search can
+        # walk incoming edges without scanning the forward CSR.
+        n_edges = len(self._edges_flat)
+        if n_edges:
+            edge_from = np.repeat(
+                np.arange(n_stops, dtype=np.int32), np.diff(offsets)
+            )
+            order = np.lexsort(
+                (self.edge_travel_min, edge_from, self.edge_to_idx)
+            )
+            sorted_to = self.edge_to_idx[order]
+            sorted_from = edge_from[order]
+            # First occurrence of each (to, from) pair carries the
+            # minimum travel time thanks to the lexsort above.
+            first = np.ones(n_edges, dtype=np.bool_)
+            first[1:] = (sorted_to[1:] != sorted_to[:-1]) | (
+                sorted_from[1:] != sorted_from[:-1]
+            )
+            rev_to = sorted_to[first]
+            self.rev_from_idx = sorted_from[first].astype(np.int32)
+            self.rev_travel_min = self.edge_travel_min[order][first].astype(
+                np.float64
+            )
+            self.rev_offsets = np.zeros(n_stops + 1, dtype=np.int64)
+            np.add.at(self.rev_offsets, rev_to + 1, 1)
+            np.cumsum(self.rev_offsets, out=self.rev_offsets)
+        else:
+            self.rev_offsets = np.zeros(n_stops + 1, dtype=np.int64)
+            self.rev_from_idx = np.zeros(0, dtype=np.int32)
+            self.rev_travel_min = np.zeros(0, dtype=np.float64)
+
+        # Hub scores indexed by stop ID (0.0 for stops without one).
+        hub = np.zeros(n_stops, dtype=np.float64)
+        for i, code in enumerate(codes):
+            stop = self._stops.get(code)
+            hub[i] = getattr(stop, "hub_score", 0.0) or 0.0 if stop else 0.0
+        self.stop_hub_score = hub
+        self.hub_score_max = float(hub.max()) if hub.size and hub.max() > 0 else 1.0
+
+        # Radian coordinates for the router's geographic A* potential
+        # (stops the stop table does not know get NaN → zero potential).
+        lat = np.full(n_stops, np.nan, dtype=np.float64)
+        lon = np.full(n_stops, np.nan, dtype=np.float64)
+        for i, code in enumerate(codes):
+            stop = self._stops.get(code)
+            if stop is not None:
+                lat[i] = getattr(stop, "latitude", np.nan)
+                lon[i] = getattr(stop, "longitude", np.nan)
+        self.stop_lat_rad = np.radians(lat)
+        self.stop_lon_rad = np.radians(lon)
+
+        self._finalised = True
+
+    # ── Disruptions (FR-JP-05) ──────────────────────────────────────
+
+    def mark_disrupted(self, route_ids: Iterable[int]) -> None:
+        """Exclude the given routes from subsequent edge queries."""
+        self._disrupted_route_ids.update(route_ids)
+        self._rebuild_disrupted_mask()
+
+    def clear_disruptions(self) -> None:
+        self._disrupted_route_ids.clear()
+        self._disrupted_mask = np.zeros(0, dtype=np.bool_)
+
+    def _rebuild_disrupted_mask(self) -> None:
+        """Rebuild the route-ID bitset after the disrupted set changes."""
+        if not self._disrupted_route_ids:
+            self._disrupted_mask = np.zeros(0, dtype=np.bool_)
+            return
+        ids = np.asarray(sorted(self._disrupted_route_ids), dtype=np.int64)
+        mask = np.zeros(int(ids.max()) + 1, dtype=np.bool_)
+        mask[ids] = True
+        self._disrupted_mask = mask
+
+    def disrupted_edge_mask(self) -> np.ndarray:
+        """Boolean mask over the flat transit-edge arrays marking edges
+        whose route is currently disrupted."""
+        n = len(self._edges_flat)
+        mask = self._disrupted_mask
+        if mask.size == 0 or n == 0:
+            return np.zeros(n, dtype=np.bool_)
+        # Route IDs beyond the bitset are by definition not disrupted.
+        clipped = np.minimum(self.edge_route_id, mask.size - 1)
+        return mask[clipped] & (self.edge_route_id < mask.size)
+
+    # ── Queries ─────────────────────────────────────────────────────
+
+    def get_stop(self, atco_code: str):
+        return self._stops.get(atco_code)
+
+    def get_route(self, route_id: int):
+        return self._routes.get(route_id)
+
+    def stop_codes(self) -> Iterable[str]:
+        return self._stops.keys()
+
+    def get_outgoing_transit_edges(
+        self, atco_code: str, earliest_departure_min: int
+    ) -> list[TransitEdge]:
+        """Return catchable transit edges leaving a stop.
+
+        An edge is catchable if it departs at or after
+        ``earliest_departure_min`` (packed minutes since midnight) and
+        its route is not disrupted.  Seeks the first feasible edge with
+        a binary search over the packed departure array, then yields the
+        tail of the contiguous SoA slice.
+        """
+        stop_idx = self.stop_id.get(atco_code)
+        if stop_idx is None:
+            return []
+        start = self.edge_offsets[stop_idx]
+        end = self.edge_offsets[stop_idx + 1]
+        if start == end:
+            return []
+        first = start + np.searchsorted(
+            self.edge_dep_min[start:end], earliest_departure_min
+        )
+        edges_flat = self._edges_flat
+        mask = self._disrupted_mask
+        if mask.size == 0:
+            return edges_flat[first:end]
+        # Vectorised bit test over the whole slice instead of a per-edge
+        # set lookup.
+        route_slice = self.edge_route_id[first:end]
+        clipped = np.minimum(route_slice, mask.size - 1)
+        keep = ~(mask[clipped] & (route_slice < mask.size))
+        return [
+            edges_flat[int(first) + j] for j in np.flatnonzero(keep)
+        ]
+
+    def get_walking_edges(self, atco_code: str) -> list[WalkingEdge]:
+        """Return walking edges leaving a stop (direction-correct views
+        over the deduplicated connection store)."""
+        return [
+            self._walking_view(idx, atco_code)
+            for idx in self._walking_incident.get(atco_code, [])
+        ]
+
+    @property
+    def stop_count(self) -> int:
+        return len(self._stops)
+
+    @property
+    def transit_edge_count(self) -> int:
+        return sum(len(v) for v in self._transit_edges.values())
+
+
+# ── Builder ──────────────────────────────────────────────────────────────
+
+def build_graph(
+    stops: Iterable,
+    routes: Iterable,
+    timetable_entries: Iterable,
+    walking_connections: Optional[Iterable[tuple[str, str, float, float]]] = None,
+) -> TransportGraph:
+    """Build a :class:`TransportGraph` from timetable data.
+
+    Args:
+        stops: Stop records (``atco_code`` attribute required).
+        routes: Route records (``route_id`` attribute required).
+        timetable_entries: Timetable records with ``route_id``,
+            ``trip_id``, ``stop_atco_code``, ``stop_sequence``,
+            ``arrival_time`` and ``departure_time`` attributes,
+            pre-sorted by ``(route_id, trip_id, stop_sequence)`` – the
+            data-access layer issues the matching ``ORDER BY`` so the
+            database (with an index) does the sort and build_graph can
+            stream-group in one pass.
+        walking_connections: Optional ``(from_atco, to_atco,
+            walk_time_mins, distance_metres)`` tuples; each produces a
+            walking edge in both directions.
+
+    Returns:
+        A finalised :class:`TransportGraph` ready for querying.
+    """
+    graph = TransportGraph()
+
+    # Step 1 – stops
+    for stop in stops:
+        graph.add_stop(stop)
+
+    # Step 2 – routes
+    for route in routes:
+        graph.add_route(route)
+
+    # Step 3 – transit edges: consecutive stop pairs within each trip.
+    # Input is pre-sorted (see docstring), so a streaming groupby avoids
+    # both the dict rehashing and the per-trip list.sort of the old
+    # grouping approach.
+    for (route_id, _trip_id), group in groupby(
+        timetable_entries, key=lambda e: (e.route_id, e.trip_id)
+    ):
+        entries = list(group)
+        for curr, nxt in zip(entries, entries[1:]):
+            departure = curr.departure_time or curr.arrival_time
+            arrival = nxt.arrival_time or nxt.departure_time
+            if departure is None or arrival is None:
+                continue
+            # Pack to int minutes exactly once; the router only ever
+            # touches the packed values.
+            departure_min = _to_minutes(departure)
+            arrival_min = _to_minutes(arrival)
+            graph.add_transit_edge(
+                TransitEdge(
+                    from_stop=sys.intern(curr.stop_atco_code),
+                    to_stop=sys.intern(nxt.stop_atco_code),
+                    route_id=route_id,
+                    departure_time=departure,
+                    arrival_time=arrival,
+                    departure_min=departure_min,
+                    arrival_min=arrival_min,
+                    travel_minutes=float((arrival_min - departure_min) % 1440),
+                )
+            )
+
+    # Step 4 – walking connections (stored once, traversable both ways)
+    for from_atco, to_atco, walk_mins, distance_m in walking_connections or []:
+        graph.add_walking_connection(from_atco, to_atco, walk_mins, distance_m)
+
+    graph.finalise()
+    logger.info(
+        "Built transport graph: %d stops, %d transit edges",
+        graph.stop_count,
+        graph.transit_edge_count,
+    )
+    return graph
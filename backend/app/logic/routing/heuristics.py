@@ -0,0 +1,148 @@
+"""
+Routing heuristics – soft adjustments applied to edge costs so the
+router prefers robust journeys, not just nominally fastest ones.
+
+Requirements:
+    RL-03: Prefer interchanges at well-served hubs.
+    RL-05: Penalise habitually delayed stops/routes.
+
+All values are expressed in equivalent minutes so they compose directly
+with the travel and wait times in ``router.py``'s relaxation loops.
+"""
+
+import logging
+
+import numpy as np
+
+from app.logic.reliability import connection_reliability_score
+
+logger = logging.getLogger(__name__)
+
+# Maximum bonus (minutes subtracted) for changing at a major hub.
+HUB_MAX_BONUS_MINS = 3.0
+
+# Maximum penalty (minutes added) for habitually delayed stops/routes.
+DELAY_MAX_PENALTY_MINS = 10.0
+
+# Connections scoring below this reliability are considered fragile.
+FRAGILE_RELIABILITY_THRESHOLD = 0.5
+
+# Fastest service the network can plausibly carry (WCML rail through
+# Lancaster); the A* geographic potential must never over-estimate.
+MAX_NETWORK_SPEED_KMH = 200.0
+
+_EARTH_RADIUS_KM = 6371.0
+
+
+def hub_bonus(
+    hub_score: float,
+    hub_score_max: float = 1.0,
+    _max_bonus: float = HUB_MAX_BONUS_MINS,
+) -> float:
+    """Return a (negative) cost adjustment for transferring at a hub.
+
+    Args:
+        hub_score: Hub importance of the stop (0..hub_score_max).
+        hub_score_max: Normalisation constant for the network.
+        _max_bonus: :data:`HUB_MAX_BONUS_MINS` baked in as a default so
+            the relaxation-path call reads a local, not a module global.
+
+    Returns:
+        Minutes to *subtract* from the edge cost (``<= 0``).
+    """
+    if hub_score_max <= 0:
+        return 0.0
+    return -_max_bonus * min(hub_score / hub_score_max, 1.0)
+
+
+def delay_penalty(
+    stop_delay_ratio: float = 0.0,
+    route_delay_ratio: float = 0.0,
+    _max_penalty: float = DELAY_MAX_PENALTY_MINS,
+) -> float:
+    """Return a (positive) cost penalty for habitually delayed legs.
+
+    Args:
+        stop_delay_ratio: Fraction of observed departures delayed at the
+            stop (0..1).
+        route_delay_ratio: Fraction of observed journeys delayed on the
+            route (0..1).
+        _max_penalty: :data:`DELAY_MAX_PENALTY_MINS` baked in as a
+            default (LOAD_FAST instead of LOAD_GLOBAL per call).
+
+    Returns:
+        Minutes to *add* to the edge cost (``>= 0``).
+    """
+    combined = (stop_delay_ratio + route_delay_ratio) / 2.0
+    return _max_penalty * max(0.0, min(combined, 1.0))
+
+
+def reliability_heuristic(
+    hub_score: float,
+    hub_score_max: float = 1.0,
+    stop_delay_ratio: float = 0.0,
+    route_delay_ratio: float = 0.0,
+) -> float:
+    """Combined soft adjustment (minutes) for one edge relaxation."""
+    return hub_bonus(hub_score, hub_score_max) + delay_penalty(
+        stop_delay_ratio, route_delay_ratio
+    )
+
+
+def is_fragile_connection(
+    transfer_time_mins: float,
+    mode: str,
+    hub_score: float = 0.0,
+) -> bool:
+    """Return True if a transfer is too tight to be trusted.
+
+    Used by the router to discard plans whose interchange would likely
+    be missed under normal delay variance (RL-03).
+    """
+    score = connection_reliability_score(transfer_time_mins, mode, hub_score)
+    return score < FRAGILE_RELIABILITY_THRESHOLD
+
+
+def geo_potential_minutes(
+    lat_rad: np.ndarray,
+    lon_rad: np.ndarray,
+    dest_lat_rad: float,
+    dest_lon_rad: float,
+) -> np.ndarray:
+    """Admissible per-stop lower bound (minutes) on travel to a point.
+
+    Equirectangular distance (adequate at city scale, far cheaper than
+    a full haversine) divided by :data:`MAX_NETWORK_SPEED_KMH`.  Stops
+    with unknown coordinates (NaN) get a zero potential, which is
+    always safe.
+    """
+    x = (lon_rad - dest_lon_rad) * np.cos(dest_lat_rad)
+    y = lat_rad - dest_lat_rad
+    dist_km = _EARTH_RADIUS_KM * np.sqrt(x * x + y * y)
+    minutes = dist_km * (60.0 / MAX_NETWORK_SPEED_KMH)
+    return np.nan_to_num(minutes, nan=0.0)
+
+
+def precompute_reliability(
+    hub_scores: np.ndarray,
+    hub_score_max: float = 1.0,
+    stop_delay_ratios: "np.ndarray | None" = None,
+    route_delay_ratios: "np.ndarray | None" = None,
+) -> np.ndarray:
+    """Per-stop reliability adjustment (minutes), vectorised.
+
+    One pass over the whole network replaces the per-relaxation scalar
+    :func:`reliability_heuristic` calls: the router indexes the result
+    by stop ID.  Matches the scalar formula exactly (hub bonus plus
+    clipped delay penalty).
+    """
+    if hub_score_max <= 0:
+        hub_score_max = 1.0
+    adjust = -HUB_MAX_BONUS_MINS * np.minimum(hub_scores / hub_score_max, 1.0)
+    if stop_delay_ratios is not None or route_delay_ratios is not None:
+        stop_d = stop_delay_ratios if stop_delay_ratios is not None else 0.0
+        route_d = route_delay_ratios if route_delay_ratios is not None else 0.0
+        adjust = adjust + DELAY_MAX_PENALTY_MINS * np.clip(
+            (stop_d + route_d) / 2.0, 0.0, 1.0
+        )
+    return adjust
@@ -0,0 +1,727 @@
+"""
+Journey router – time-dependent shortest-path search over the
+:class:`TransportGraph` (Design Doc §5.2).
+
+Requirements:
+    FR-JP-01: Plan a multi-modal journey.
+    FR-JP-03: Up to k route options (alternatives by edge exclusion).
+    RL-03:    Robust plans are preferred over marginally faster ones.
+
+Two equivalent search engines share one cost model (wait + travel +
+per-stop reliability adjustment, walking scaled by WALK_COST_FACTOR):
+
+    * ``_dijkstra_search`` – pure-Python modified Dijkstra over the
+      graph's object API; always available.
+    * ``dijkstra_core``    – Numba-compiled kernel over the SoA arrays
+      (``_dijkstra_numba``); used automatically when numba is
+      importable, typically 20-50× faster on the numeric core.
+
+Searches are bounded to a single service day (no midnight wrap).
+"""
+
+import heapq
+import logging
+import math
+from dataclasses import dataclass
+from datetime import time
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+from app.logic.routing._dijkstra_numba import (
+    HAVE_NUMBA,
+    dijkstra_core,
+    lower_bounds_core,
+)
+from app.logic.routing.cost_function import WALK_COST_FACTOR
+from app.logic.routing.graph_builder import (
+    KIND_TRANSIT,
+    KIND_WALK,
+    TransportGraph,
+)
+from app.logic.routing.heuristics import (
+    HUB_MAX_BONUS_MINS,
+    geo_potential_minutes,
+    is_fragile_connection,
+    precompute_reliability,
+)
+
+logger = logging.getLogger(__name__)
+
+# Safety valve: never expand more nodes than this per search.
+MAX_EXPANSIONS = 50_000
+
+# Alternative journeys costing more than this multiple of the best
+# journey are not worth surfacing; re-runs prune against it.
+ALT_COST_FACTOR = 1.5
+
+# Local alias: resolving math.inf is an attribute lookup per use; the
+# search loop touches infinity on every relaxation.
+_INF = float("inf")
+
+# Dial bucket queue for the pure-Python search, mirroring the kernel's:
+# costs are minutes quantised to 0.1-minute ticks and capped at two
+# days, so push and extract-min are O(1) list ops against a
+# forward-only cursor instead of O(log n) heap sifts.
+_TICKS_PER_MIN = 10
+_MAX_COST_MIN = 2880
+_N_BUCKETS = _MAX_COST_MIN * _TICKS_PER_MIN + 1
+
+
+# ── Result types ─────────────────────────────────────────────────────────
+
+@dataclass(slots=True)
+class JourneyLeg:
+    """One leg of a planned journey (a ride on one service, or a walk)."""
+
+    mode: str
+    route_name: Optional[str]
+    operator: Optional[str]
+    origin_stop: object
+    destination_stop: object
+    departure_time: time
+    arrival_time: time
+    duration_mins: float
+    is_walking: bool = False
+
+
+@dataclass(slots=True)
+class JourneyPlan:
+    """A complete journey option."""
+
+    legs: list[JourneyLeg]
+    total_duration_mins: float
+    total_changes: int
+    departure_time: time
+    arrival_time: time
+
+
+def _min_to_time(minutes: int) -> time:
+    """Unpack minutes-since-midnight back into a ``datetime.time``."""
+    return time((minutes // 60) % 24, minutes % 60)
+
+
+# ── Pure-Python search ───────────────────────────────────────────────────
+
+class _SearchBuffers:
+    """Request-scoped search state shared across the k alternative runs.
+
+    Instead of reallocating the cost array and predecessor slots for
+    every rerun, each slot carries a generation tag: bumping the counter
+    between runs is O(1) and stale-tagged slots read as uninitialised.
+    Exposes dict-style ``get(atco)`` so :func:`_trace_python` can walk
+    the predecessor chain unchanged.
+    """
+
+    __slots__ = ("best_cost", "pred", "gen", "generation", "stop_id")
+
+    def __init__(self, graph: TransportGraph):
+        n = len(graph.id_to_atco)
+        self.best_cost = np.full(n, _INF, dtype=np.float64)
+        self.pred: list = [None] * n
+        # Generation 0 means "never written", so the first run's bump
+        # to 1 leaves every slot stale without touching the arrays.
+        self.gen = np.zeros(n, dtype=np.int64)
+        self.generation = 0
+        self.stop_id = graph.stop_id
+
+    def next_run(self) -> None:
+        """Invalidate all slots for the next search (O(1))."""
+        self.generation += 1
+
+    def get(self, atco: str):
+        """Predecessor entry for a stop, or None if unreached this run."""
+        idx = self.stop_id.get(atco)
+        if idx is None or self.gen[idx] != self.generation:
+            return None
+        return self.pred[idx]
+
+
+def _stop_adjustments(graph: TransportGraph) -> np.ndarray:
+    """Per-stop reliability adjustment vector, identical for both
+    engines (delay ratios join in once live delay data feeds them)."""
+    return precompute_reliability(graph.stop_hub_score, graph.hub_score_max)
+
+
+def _backward_lower_bounds(graph: TransportGraph, dest_idx: int) -> np.ndarray:
+    """Exact static lower bounds (minutes) from every stop to ``dest_idx``.
+
+    A plain backward Dijkstra over the reverse static adjacency – the
+    meet-in-the-middle half of a bidirectional search.  A true backward
+    *time-dependent* search is unsound here (edge costs depend on the
+    unknown departure time), so the backward pass instead uses each
+    pair's minimum travel time less the maximum hub bonus: that always
+    under-estimates the forward cost (wait >= 0), making the bounds
+    admissible and consistent potentials for the forward search.
+
+    Computed once per (graph, destination) and reused by all k
+    alternative searches of a query.
+    """
+    if HAVE_NUMBA:
+        return lower_bounds_core(
+            graph.rev_offsets,
+            graph.rev_from_idx,
+            graph.rev_travel_min,
+            graph.walk_offsets,
+            graph.walk_to_idx,
+            graph.walk_minutes,
+            dest_idx,
+            HUB_MAX_BONUS_MINS,
+            WALK_COST_FACTOR,
+        )
+
+    n = len(graph.id_to_atco)
+    dist = np.full(n, _INF, dtype=np.float64)
+    dist[dest_idx] = 0.0
+    pq = [(0.0, dest_idx)]
+    rev_offsets = graph.rev_offsets
+    rev_from_idx = graph.rev_from_idx
+    rev_travel_min = graph.rev_travel_min
+    walk_offsets = graph.walk_offsets
+    walk_to_idx = graph.walk_to_idx
+    walk_minutes = graph.walk_minutes
+
+    while pq:
+        d, node = heapq.heappop(pq)
+        if d > dist[node]:
+            continue
+        for j in range(rev_offsets[node], rev_offsets[node + 1]):
+            src = rev_from_idx[j]
+            nd = d + max(0.0, rev_travel_min[j] - HUB_MAX_BONUS_MINS)
+            if nd < dist[src]:
+                dist[src] = nd
+                heapq.heappush(pq, (nd, int(src)))
+        # Walking is symmetric, so the forward CSR doubles as reverse.
+        for k in range(walk_offsets[node], walk_offsets[node + 1]):
+            src = walk_to_idx[k]
+            nd = d + walk_minutes[k] * WALK_COST_FACTOR
+            if nd < dist[src]:
+                dist[src] = nd
+                heapq.heappush(pq, (nd, int(src)))
+    return dist
+
+
+def _dijkstra_search(
+    graph: TransportGraph,
+    origin_atco: str,
+    destination_atco: str,
+    dep_min: int,
+    excluded_edges: frozenset = frozenset(),
+    lower_bounds: Optional[np.ndarray] = None,
+    cost_upper_bound: float = _INF,
+    buffers: Optional[_SearchBuffers] = None,
+):
+    """Modified Dijkstra over the graph's SoA arrays.
+
+    Per-stop expansion is vectorised: the outgoing CSR slice is relaxed
+    in one numpy pass (wait + travel + hub adjustment, compare against
+    the best-cost array), and only the improving edges fall back to
+    Python for the heap push and predecessor bookkeeping.
+
+    ``cost_upper_bound`` caps the explored cost range: because bucket
+    priorities are admissible lower bounds on total cost, the search
+    can stop as soon as the cursor passes the bound.
+
+    ``buffers`` lets the k-alternative loop share one set of search
+    arrays across reruns (see :class:`_SearchBuffers`); omitted, a fresh
+    set is allocated.
+
+    Returns ``(predecessors, dest_cost)`` where ``predecessors`` maps
+    each reached stop to ``(prev_atco, edge, arrival_min)`` via ``get``.
+    """
+    origin_idx = graph.stop_id[origin_atco]
+    dest_idx = graph.stop_id[destination_atco]
+    id_to_atco = graph.id_to_atco
+    edges_flat = graph._edges_flat
+    walks_flat = graph._walks_flat
+    edge_offsets = graph.edge_offsets
+    edge_dep_min = graph.edge_dep_min
+    edge_travel_min = graph.edge_travel_min
+    edge_to_idx = graph.edge_to_idx
+    walk_offsets = graph.walk_offsets
+    walk_to_idx = graph.walk_to_idx
+    walk_minutes = graph.walk_minutes
+    adjust = _stop_adjustments(graph)
+    edge_disrupted = graph.disrupted_edge_mask()
+    if lower_bounds is None:
+        lower_bounds = _backward_lower_bounds(graph, dest_idx)
+    if not math.isfinite(lower_bounds[origin_idx]):
+        return {}, _INF  # destination statically unreachable
+
+    # Bind hot globals/attributes to locals once: the loop below runs up
+    # to MAX_EXPANSIONS times and LOAD_FAST is materially cheaper than
+    # LOAD_GLOBAL + LOAD_ATTR per iteration.
+    searchsorted = np.searchsorted
+    flatnonzero = np.flatnonzero
+    np_maximum = np.maximum
+    np_where = np.where
+    isfinite = math.isfinite
+    ceil = math.ceil
+
+    if buffers is None:
+        buffers = _SearchBuffers(graph)
+    buffers.next_run()
+    best_cost = buffers.best_cost
+    pred = buffers.pred
+    gen = buffers.gen
+    cur_gen = buffers.generation
+    best_cost[origin_idx] = 0.0
+    gen[origin_idx] = cur_gen
+    # Buckets are created lazily: most searches touch a small cost
+    # range, so preallocating 28k lists per query would cost more than
+    # the queue saves.
+    buckets: list = [None] * _N_BUCKETS
+    buckets[0] = [(0.0, origin_idx, dep_min)]
+    cursor = 0
+
+    def _push(entry_cost: float, entry_node: int, entry_arr: int) -> None:
+        # Order by cost + lower bound (A*): with consistent potentials
+        # the forward search stays label-setting but expands only the
+        # cone that can still reach the destination competitively.
+        b = int((entry_cost + lower_bounds[entry_node]) * _TICKS_PER_MIN + 0.5)
+        if b < cursor:
+            b = cursor  # quantisation never moves behind the cursor
+        elif b >= _N_BUCKETS:
+            b = _N_BUCKETS - 1
+        bucket = buckets[b]
+        if bucket is None:
+            buckets[b] = [(entry_cost, entry_node, entry_arr)]
+        else:
+            bucket.append((entry_cost, entry_node, entry_arr))
+
+    max_bucket = _N_BUCKETS
+    if cost_upper_bound < _MAX_COST_MIN:
+        max_bucket = int(cost_upper_bound * _TICKS_PER_MIN) + 1
+
+    # Destination pruning: once any path reaches the destination, no
+    # node whose g + h exceeds that cost can lie on a better one (the
+    # bounds are admissible), so such relaxations are dropped outright
+    # and the explored cost range shrinks to the proven optimum.
+    best_dest = cost_upper_bound
+
+    expansions = 0
+    while cursor < max_bucket and expansions < MAX_EXPANSIONS:
+        bucket = buckets[cursor]
+        if not bucket:
+            cursor += 1
+            continue
+        cost, node, arr = bucket.pop()
+        # Every pushed node has a best_cost slot, so compare directly
+        # and skip unless this entry set the current optimum.
+        if cost != best_cost[node]:
+            continue  # stale lazy-deletion entry
+        if node == dest_idx:
+            break
+        expansions += 1
+
+        start = edge_offsets[node]
+        end = edge_offsets[node + 1]
+        if start < end and arr <= 1439:
+            lo = start + searchsorted(edge_dep_min[start:end], arr)
+            if lo < end:
+                to = edge_to_idx[lo:end]
+                wait = edge_dep_min[lo:end].astype(np.float64) - arr
+                travel = np_maximum(
+                    edge_travel_min[lo:end] + adjust[to], 0.0
+                )
+                new_costs = cost + wait + travel
+                # Slots from an earlier generation read as unreached.
+                old = np_where(gen[to] == cur_gen, best_cost[to], _INF)
+                candidates = flatnonzero(
+                    (new_costs < old) & ~edge_disrupted[lo:end]
+                )
+                for c in candidates:
+                    j = int(lo) + int(c)
+                    to_idx = int(to[c])
+                    new_cost = float(new_costs[c])
+                    # Re-check: an earlier candidate in this batch may
+                    # have already improved the same destination.
+                    if gen[to_idx] == cur_gen and new_cost >= best_cost[to_idx]:
+                        continue
+                    if not isfinite(lower_bounds[to_idx]):
+                        continue  # cannot reach the destination at all
+                    if new_cost + lower_bounds[to_idx] > best_dest:
+                        continue  # cannot beat the best path found
+                    edge = edges_flat[j]
+                    if edge in excluded_edges:
+                        continue
+                    best_cost[to_idx] = new_cost
+                    gen[to_idx] = cur_gen
+                    arrival = edge.departure_min + int(edge.travel_minutes)
+                    pred[to_idx] = (id_to_atco[node], edge, arrival)
+                    _push(new_cost, to_idx, arrival)
+                    if to_idx == dest_idx and new_cost < best_dest:
+                        best_dest = new_cost
+                        b = int(best_dest * _TICKS_PER_MIN) + 1
+                        if b < max_bucket:
+                            max_bucket = b
+
+        wstart = walk_offsets[node]
+        wend = walk_offsets[node + 1]
+        for k in range(wstart, wend):
+            to_idx = int(walk_to_idx[k])
+            new_cost = cost + walk_minutes[k] * WALK_COST_FACTOR
+            if gen[to_idx] != cur_gen or new_cost < best_cost[to_idx]:
+                if not isfinite(lower_bounds[to_idx]):
+                    continue
+                if new_cost + lower_bounds[to_idx] > best_dest:
+                    continue
+                wedge = walks_flat[k]
+                if wedge in excluded_edges:
+                    continue
+                best_cost[to_idx] = new_cost
+                gen[to_idx] = cur_gen
+                arrival = arr + ceil(walk_minutes[k])
+                pred[to_idx] = (id_to_atco[node], wedge, arrival)
+                _push(new_cost, to_idx, arrival)
+                if to_idx == dest_idx and new_cost < best_dest:
+                    best_dest = new_cost
+                    b = int(best_dest * _TICKS_PER_MIN) + 1
+                    if b < max_bucket:
+                        max_bucket = b
+
+    dest_cost = (
+        float(best_cost[dest_idx]) if gen[dest_idx] == cur_gen else _INF
+    )
+    return buffers, dest_cost
+
+
+def _trace_python(predecessors: dict, origin_atco: str, destination_atco: str):
+    """Walk the predecessor map back into an ordered edge path."""
+    path: list[tuple[object, int]] = []
+    node = destination_atco
+    while node != origin_atco:
+        entry = predecessors.get(node)
+        if entry is None:
+            return None
+        prev_atco, edge, arrival = entry
+        path.append((edge, arrival))
+        node = prev_atco
+    path.reverse()
+    return path
+
+
+# ── Numba kernel driver ──────────────────────────────────────────────────
+
+def _run_kernel(
+    graph: TransportGraph,
+    origin_idx: int,
+    dest_idx: int,
+    dep_min: int,
+    edge_excluded: np.ndarray,
+    cost_upper_bound: float = _INF,
+):
+    """Run the compiled kernel and trace the path back to edge objects."""
+    stop_adjust = _stop_adjustments(graph)
+    # Geographic A* potential toward the destination; all-zero when the
+    # destination has no known coordinates.
+    dest_lat = graph.stop_lat_rad[dest_idx]
+    dest_lon = graph.stop_lon_rad[dest_idx]
+    if math.isfinite(dest_lat) and math.isfinite(dest_lon):
+        stop_potential = geo_potential_minutes(
+            graph.stop_lat_rad, graph.stop_lon_rad, dest_lat, dest_lon
+        )
+    else:
+        stop_potential = np.zeros(len(graph.id_to_atco), dtype=np.float64)
+    best_cost, arrival, parent_node, parent_edge = dijkstra_core(
+        graph.edge_offsets,
+        graph.edge_dep_min,
+        graph.edge_travel_min,
+        graph.edge_to_idx,
+        graph.walk_offsets,
+        graph.walk_to_idx,
+        graph.walk_minutes,
+        stop_adjust,
+        stop_potential,
+        edge_excluded,
+        origin_idx,
+        dest_idx,
+        dep_min,
+        WALK_COST_FACTOR,
+        MAX_EXPANSIONS,
+        cost_upper_bound,
+    )
+    if not math.isfinite(best_cost[dest_idx]):
+        return None
+
+    path: list[tuple[object, int]] = []
+    node = dest_idx
+    while node != origin_idx:
+        j = parent_edge[node]
+        if j >= 0:
+            path.append((graph._edges_flat[j], int(arrival[node])))
+        else:
+            path.append((graph._walks_flat[-j - 2], int(arrival[node])))
+        node = parent_node[node]
+    path.reverse()
+    return path
+
+
+# ── Plan reconstruction ──────────────────────────────────────────────────
+
+def _reconstruct(
+    graph: TransportGraph, path: list, dep_min: int
+) -> Optional[JourneyPlan]:
+    """Assemble a :class:`JourneyPlan` from an ordered edge path.
+
+    Consecutive transit edges on the same route merge into one leg.
+    """
+    if not path:
+        return None
+
+    # One lookup per distinct stop/route up front; the leg loop (and its
+    # merge branches) then reads plain locals instead of re-hitting the
+    # graph's dicts for stops that repeat along the path.
+    stops_cache: dict = {}
+    routes_cache: dict = {}
+    for edge, _ in path:
+        if edge.kind == KIND_TRANSIT:
+            if edge.route_id not in routes_cache:
+                routes_cache[edge.route_id] = graph.get_route(edge.route_id)
+        for code in (edge.from_stop, edge.to_stop):
+            if code not in stops_cache:
+                stops_cache[code] = graph.get_stop(code)
+
+    legs: list[JourneyLeg] = []
+    current_min = dep_min
+    i = 0
+    while i < len(path):
+        edge, arrival = path[i]
+        if edge.kind == KIND_WALK:
+            legs.append(
+                JourneyLeg(
+                    mode="walk",
+                    route_name=None,
+                    operator=None,
+                    origin_stop=stops_cache[edge.from_stop],
+                    destination_stop=stops_cache[edge.to_stop],
+                    departure_time=_min_to_time(current_min),
+                    arrival_time=_min_to_time(arrival),
+                    duration_mins=float(arrival - current_min),
+                    is_walking=True,
+                )
+            )
+            current_min = arrival
+            i += 1
+            continue
+
+        # Merge the run of transit edges on the same route.
+        run_start = i
+        while (
+            i + 1 < len(path)
+            and path[i + 1][0].kind == KIND_TRANSIT
+            and path[i + 1][0].route_id == edge.route_id
+        ):
+            i += 1
+        last_edge, last_arrival = path[i]
+        route = routes_cache[edge.route_id]
+        legs.append(
+            JourneyLeg(
+                mode=getattr(route, "transport_mode", "bus") if route else "bus",
+                route_name=getattr(route, "route_name", None) if route else None,
+                operator=getattr(route, "operator", None) if route else None,
+                origin_stop=stops_cache[path[run_start][0].from_stop],
+                destination_stop=stops_cache[last_edge.to_stop],
+                departure_time=edge.departure_time,
+                arrival_time=_min_to_time(last_arrival),
+                duration_mins=float(last_arrival - edge.departure_min),
+                is_walking=False,
+            )
+        )
+        current_min = last_arrival
+        i += 1
+
+    transit_legs = sum(1 for leg in legs if not leg.is_walking)
+    return JourneyPlan(
+        legs=legs,
+        total_duration_mins=float(current_min - dep_min),
+        total_changes=max(0, transit_legs - 1),
+        departure_time=legs[0].departure_time,
+        arrival_time=legs[-1].arrival_time,
+    )
+
+
+def _has_fragile_connection(graph: TransportGraph, path: list) -> bool:
+    """True if any transfer in the path is too tight to trust (RL-03)."""
+    prev_edge = None
+    prev_arrival = None
+    for edge, arrival in path:
+        if (
+            edge.kind == KIND_TRANSIT
+            and prev_edge is not None
+            and prev_edge.kind == KIND_TRANSIT
+            and edge.route_id != prev_edge.route_id
+        ):
+            transfer = edge.departure_min - prev_arrival
+            route = graph.get_route(prev_edge.route_id)
+            mode = getattr(route, "transport_mode", "bus") if route else "bus"
+            stop = graph.get_stop(edge.from_stop)
+            hub_score = (
+                getattr(stop, "hub_score", 0.0) or 0.0 if stop else 0.0
+            )
+            if is_fragile_connection(transfer, mode, hub_score):
+                return True
+        prev_edge, prev_arrival = edge, arrival
+    return False
+
+
+# ── Public API ───────────────────────────────────────────────────────────
+
+def find_journeys(
+    graph: TransportGraph,
+    origin_atco: str,
+    destination_atco: str,
+    departure_time: time,
+    max_results: int = 3,
+) -> list[JourneyPlan]:
+    """Find up to ``max_results`` journey options, best first.
+
+    Alternatives are produced by excluding the first transit edge of
+    each found journey and re-running the search; plans whose transfers
+    are fragile sort after robust ones.
+    """
+    dep_min = departure_time.hour * 60 + departure_time.minute
+    if origin_atco not in graph.stop_id or destination_atco not in graph.stop_id:
+        logger.info(
+            "Unknown origin/destination: %s -> %s", origin_atco, destination_atco
+        )
+        return []
+    use_kernel = HAVE_NUMBA
+
+    results: list[tuple[bool, JourneyPlan]] = []
+    excluded_objs: set = set()
+    edge_excluded = graph.disrupted_edge_mask()
+    # The backward bounds depend only on (graph, destination), so one
+    # pass serves all k alternative searches below.
+    lower_bounds = (
+        None if use_kernel
+        else _backward_lower_bounds(graph, graph.stop_id[destination_atco])
+    )
+    # One set of search buffers serves all reruns: clearing between
+    # them is a generation bump, not an O(n) refill.
+    buffers = None if use_kernel else _SearchBuffers(graph)
+
+    # After the first journey is found, its cost bounds later re-runs:
+    # alternatives beyond ALT_COST_FACTOR x the best are not useful.
+    cost_upper_bound = _INF
+
+    for _ in range(max_results):
+        if use_kernel:
+            path = _run_kernel(
+                graph,
+                graph.stop_id[origin_atco],
+                graph.stop_id[destination_atco],
+                dep_min,
+                edge_excluded,
+                cost_upper_bound=cost_upper_bound,
+            )
+        else:
+            predecessors, dest_cost = _dijkstra_search(
+                graph,
+                origin_atco,
+                destination_atco,
+                dep_min,
+                frozenset(excluded_objs),
+                lower_bounds=lower_bounds,
+                cost_upper_bound=cost_upper_bound,
+                buffers=buffers,
+            )
+            path = (
+                _trace_python(predecessors, origin_atco, destination_atco)
+                if math.isfinite(dest_cost)
+                else None
+            )
+        if path is None:
+            break
+
+        plan = _reconstruct(graph, path, dep_min)
+        if plan is not None:
+            results.append((_has_fragile_connection(graph, path), plan))
+            if not math.isfinite(cost_upper_bound):
+                cost_upper_bound = plan.total_duration_mins * ALT_COST_FACTOR
+
+        # Exclude this journey's first transit edge to force an
+        # alternative on the next run.
+        first_transit = next(
+            (e for e, _ in path if e.kind == KIND_TRANSIT), None
+        )
+        if first_transit is None:
+            break
+        if use_kernel:
+            edge_excluded = edge_excluded.copy()
+            start = graph.edge_offsets[graph.stop_id[first_transit.from_stop]]
+            end = graph.edge_offsets[graph.stop_id[first_transit.from_stop] + 1]
+            for j in range(start, end):
+                if graph._edges_flat[j] is first_transit:
+                    edge_excluded[j] = True
+                    break
+        else:
+            excluded_objs.add(first_transit)
+
+    # Robust plans first, then by duration; drop duplicates.
+    results.sort(key=lambda item: (item[0], item[1].total_duration_mins))
+    plans: list[JourneyPlan] = []
+    seen: set = set()
+    for _, plan in results:
+        signature = tuple(
+            (leg.mode, leg.departure_time, leg.arrival_time) for leg in plan.legs
+        )
+        if signature not in seen:
+            seen.add(signature)
+            plans.append(plan)
+    return plans
+
+
+# ── Plan cache ───────────────────────────────────────────────────────────
+#
+# Commute queries repeat heavily (same origin/destination pair, nearby
+# departure times).  Departures are bucketed to 5-minute windows so a
+# whole window shares one search; the graph participates in the key by
+# identity, so a hot-swapped graph naturally misses.  The disruption
+# refresh clears the cache whenever the active set changes.
+
+_PLAN_CACHE_BUCKET_MINS = 5
+
+
+@lru_cache(maxsize=4096)
+def _find_journeys_bucketed(
+    graph: TransportGraph,
+    origin_atco: str,
+    destination_atco: str,
+    dep_bucket: int,
+    max_results: int,
+) -> tuple:
+    minutes = dep_bucket * _PLAN_CACHE_BUCKET_MINS
+    return tuple(
+        find_journeys(
+            graph,
+            origin_atco,
+            destination_atco,
+            time(minutes // 60, minutes % 60),
+            max_results=max_results,
+        )
+    )
+
+
+def find_journeys_cached(
+    graph: TransportGraph,
+    origin_atco: str,
+    destination_atco: str,
+    departure_time: time,
+    max_results: int = 3,
+) -> list[JourneyPlan]:
+    """LRU-cached :func:`find_journeys` over 5-minute departure buckets."""
+    dep_bucket = (
+        departure_time.hour * 60 + departure_time.minute
+    ) // _PLAN_CACHE_BUCKET_MINS
+    return list(
+        _find_journeys_bucketed(
+            graph, origin_atco, destination_atco, dep_bucket, max_results
+        )
+    )
+
+
+def clear_journey_cache() -> None:
+    """Drop all cached plans (called when disruptions change)."""
+    _find_journeys_bucketed.cache_clear()
@@ -0,0 +1,134 @@
+"""
+In-process spatial index over stops for nearest-stop lookups.
+
+Resolving a user's coordinates to candidate stops happens once per
+journey request; a linear scan over every stop in the network is O(N)
+Python-level work, and a database round-trip per lookup is slower than
+the search it serves.  Instead the stops are sorted by the Morton
+(z-order) code of their quantised coordinates: points close on the
+curve are close in space, so a radius query is two ``np.searchsorted``
+calls bracketing the query box followed by a short vectorised scan of
+the candidate range.
+
+The curve order is only locality-*preserving*, not exact – the code
+range for a box also covers cells outside it – so candidates are always
+re-checked against true coordinates before ranking.
+"""
+
+import logging
+import math
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Quantisation: 21 bits per axis interleave into a 42-bit code, well
+# inside int64 and ~10 cm of latitude resolution.
+_BITS = 21
+_LAT_STEPS = (1 << _BITS) - 1
+_LON_STEPS = (1 << _BITS) - 1
+
+# Metres per degree of latitude (WGS-84 mean); longitude scales by
+# cos(latitude) at query time.
+_METRES_PER_DEG = 111_320.0
+
+
+def _spread_bits(v: np.ndarray) -> np.ndarray:
+    """Space the low 21 bits of each value out to every second bit."""
+    v = v & 0x1FFFFF
+    v = (v | (v << 16)) & 0x0000FFFF0000FFFF
+    v = (v | (v << 8)) & 0x00FF00FF00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F0F0F0F0F
+    v = (v | (v << 2)) & 0x3333333333333333
+    v = (v | (v << 1)) & 0x5555555555555555
+    return v
+
+
+def _morton_codes(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Morton codes for arrays of WGS-84 coordinates (degrees)."""
+    lat_q = np.clip(
+        ((lat + 90.0) / 180.0 * _LAT_STEPS), 0, _LAT_STEPS
+    ).astype(np.int64)
+    lon_q = np.clip(
+        ((lon + 180.0) / 360.0 * _LON_STEPS), 0, _LON_STEPS
+    ).astype(np.int64)
+    return _spread_bits(lat_q) | (_spread_bits(lon_q) << 1)
+
+
+class StopSpatialIndex:
+    """Z-order curve index over stop coordinates.
+
+    Built once per graph (stops change only on timetable reloads) and
+    queried with :meth:`nearest` per request.
+    """
+
+    def __init__(self, atco_codes: list[str], lat: np.ndarray, lon: np.ndarray):
+        codes = _morton_codes(lat, lon)
+        order = np.argsort(codes, kind="stable")
+        self._codes = codes[order]
+        self._lat = lat[order]
+        self._lon = lon[order]
+        self._atco = [atco_codes[i] for i in order]
+
+    @classmethod
+    def from_stops(cls, stops) -> "StopSpatialIndex":
+        """Build from an iterable of Stop-like objects (atco_code,
+        latitude, longitude); rows without coordinates are skipped."""
+        atco, lats, lons = [], [], []
+        for stop in stops:
+            lat = getattr(stop, "latitude", None)
+            lon = getattr(stop, "longitude", None)
+            if lat is None or lon is None:
+                continue
+            atco.append(stop.atco_code)
+            lats.append(float(lat))
+            lons.append(float(lon))
+        return cls(
+            atco,
+            np.asarray(lats, dtype=np.float64),
+            np.asarray(lons, dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self._atco)
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        radius_m: float = 500.0,
+        max_results: int = 5,
+    ) -> list[tuple[str, float]]:
+        """Stops within ``radius_m`` of a point, nearest first.
+
+        Returns up to ``max_results`` ``(atco_code, distance_m)``
+        pairs.  The z-code range bracketing the query box is located by
+        binary search; only that slice is distance-checked.
+        """
+        if not self._atco:
+            return []
+        dlat = radius_m / _METRES_PER_DEG
+        dlon = radius_m / (
+            _METRES_PER_DEG * max(math.cos(math.radians(lat)), 1e-6)
+        )
+        zlo, zhi = _morton_codes(
+            np.array([lat - dlat, lat + dlat]),
+            np.array([lon - dlon, lon + dlon]),
+        )
+        lo = int(np.searchsorted(self._codes, zlo, side="left"))
+        hi = int(np.searchsorted(self._codes, zhi, side="right"))
+        if lo >= hi:
+            return []
+
+        # Verify true distances over the candidate slice
+        # (equirectangular – adequate at stop-spacing scale).
+        cand_lat = self._lat[lo:hi]
+        cand_lon = self._lon[lo:hi]
+        dy = (cand_lat - lat) * _METRES_PER_DEG
+        dx = (cand_lon - lon) * _METRES_PER_DEG * math.cos(math.radians(lat))
+        dist = np.sqrt(dx * dx + dy * dy)
+        within = np.flatnonzero(dist <= radius_m)
+        if within.size == 0:
+            return []
+        ranked = within[np.argsort(dist[within], kind="stable")][:max_results]
+        return [(self._atco[lo + int(i)], float(dist[int(i)])) for i in ranked]
@@ -14,14 +14,25 @@ Responsibilities:
     • Set up the database engine and session on startup; tear down on shutdown.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
+try:  # Brotli compresses ~20% tighter; optional, gzip always works
+    from brotli_asgi import BrotliMiddleware
+except ImportError:  # pragma: no cover
+    BrotliMiddleware = None
+
+from app.api.responses import APIJSONResponse
 from app.config import get_settings
+from app.logic.disruption_handler import refresh_disruptions_loop
+from app.management.cache import close_redis
 from app.management.data_access import engine, sessionmanager
+from app.services.journey_service import build_graph_from_db
 
 # Import route modules
 from app.api.routes import departures, journey, live, map as map_routes
@@ -42,14 +53,53 @@ async def lifespan(application: FastAPI):
 
     # Startup
     logger.info("Starting LancasterLink backend v%s", settings.app_version)
-    sessionmanager.init(settings.database_url)
+    sessionmanager.init(
+        settings.database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
     logger.info("Database engine initialised")
 
+    # Build the transport graph once and share it via app.state – a
+    # city timetable takes seconds to assemble, a search milliseconds.
+    # journey_service.rebuild_graph double-buffers timetable reloads.
+    application.state.graph = None
+    application.state.graph_lock = asyncio.Lock()
+    try:
+        async with sessionmanager.session() as db:
+            application.state.graph = await build_graph_from_db(db)
+        logger.info(
+            "Transport graph ready (%d stops)", application.state.graph.stop_count
+        )
+    except Exception:
+        logger.exception(
+            "Could not build transport graph at startup; "
+            "/api/journey will return 503 until a reload succeeds"
+        )
+
+    # Keep the active-disruption cache warm (FR-JP-05) and mirror set
+    # changes onto the shared graph (under graph_lock) so journey
+    # requests read the graph without locking or querying per request.
+    disruption_task = asyncio.create_task(
+        refresh_disruptions_loop(
+            interval=settings.polling_interval_seconds,
+            application=application,
+        )
+    )
+
     yield  # ← application runs here
 
     # Shutdown
     logger.info("Shutting down – disposing DB engine")
-    sessionmanager.close()
+    disruption_task.cancel()
+    try:
+        await disruption_task
+    except asyncio.CancelledError:
+        pass
+    await close_redis()
+    await sessionmanager.close()
 
 
 # ── Application factory ─────────────────────────────────────────────────────
@@ -60,6 +110,7 @@ app = FastAPI(
     title=settings.app_title,
     version=settings.app_version,
     lifespan=lifespan,
+    default_response_class=APIJSONResponse,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
@@ -78,6 +129,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ── Response compression ─────────────────────────────────────────────────────
+# Journey plans and departure boards are highly compressible text; on
+# mobile clients (NFR-UA-01) the bandwidth saved dwarfs the compression
+# CPU.  Brotli is preferred when installed (it falls back to gzip for
+# clients that do not accept br); plain gzip otherwise.  Bodies under
+# 1 KiB are left alone – headers would eat the savings.
+
+if BrotliMiddleware is not None:
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1024)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # ── Health check ─────────────────────────────────────────────────────────────
 # Used by docker-compose healthcheck and the frontend to confirm the API
@@ -0,0 +1,142 @@
+"""
+LancasterLink – Redis response cache for hot read endpoints.
+
+The map-state and departure-board endpoints are polled repeatedly with
+identical parameters (every viewport pan / board refresh), while the
+underlying data changes on a seconds-to-minutes scale.  Caching the
+serialised JSON body in Redis turns a multi-join PostGIS query into a
+sub-millisecond GET for repeat requests.
+
+Cache keys:
+    map:state:{n}:{s}:{e}:{w}   – bbox snapped outward to a 0.01° grid
+                                  so nearby viewports share an entry
+    departures:{stop_id}        – per-stop departure board
+
+If Redis is unreachable the decorators degrade to a plain pass-through,
+so a cache outage never takes the API down.
+"""
+
+import functools
+import logging
+import math
+
+import redis.asyncio as aioredis
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_redis: aioredis.Redis | None = None
+
+
+def get_redis() -> aioredis.Redis:
+    """Return the shared async Redis client, creating it lazily."""
+    global _redis
+    if _redis is None:
+        _redis = aioredis.from_url(get_settings().redis_url)
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client (called from lifespan shutdown)."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+def cached_response(key_builder, ttl_seconds: int):
+    """Cache a route handler's JSON body in Redis.
+
+    Args:
+        key_builder: Callable receiving the handler's keyword arguments
+            and returning the cache key string.
+        ttl_seconds: Expiry for the cached body.
+
+    The wrapped handler must return a Pydantic model or a JSON
+    ``Response`` (whose body bytes are cached as-is).  On a hit the
+    cached bytes are returned directly, skipping both the DB query and
+    serialisation.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = key_builder(**kwargs)
+            try:
+                cached = await get_redis().get(key)
+            except (aioredis.RedisError, OSError) as exc:
+                logger.debug("Redis unavailable for %s: %s", key, exc)
+                return await func(*args, **kwargs)
+
+            if cached is not None:
+                return Response(content=cached, media_type="application/json")
+
+            result = await func(*args, **kwargs)
+            if isinstance(result, BaseModel):
+                body = result.model_dump_json()
+            elif isinstance(result, Response):
+                body = result.body
+            else:
+                return result
+            try:
+                await get_redis().set(key, body, ex=ttl_seconds)
+            except (aioredis.RedisError, OSError) as exc:
+                logger.debug("Redis write failed for %s: %s", key, exc)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+async def invalidate(pattern: str) -> int:
+    """Delete all cache entries matching ``pattern`` (e.g. ``map:state:*``).
+
+    Used by the ingestion pipeline when disruptions or live data change
+    faster than the TTL.  Returns the number of keys removed.
+    """
+    client = get_redis()
+    removed = 0
+    try:
+        async for key in client.scan_iter(match=pattern):
+            removed += await client.delete(key)
+    except (aioredis.RedisError, OSError) as exc:
+        logger.debug("Redis invalidation failed for %s: %s", pattern, exc)
+    return removed
+
+
+# ── Key builders ─────────────────────────────────────────────────────────
+
+def snap_bbox_outward(
+    north: float, south: float, east: float, west: float
+) -> tuple[float, float, float, float]:
+    """Snap a viewport outward to the 0.01° (~1 km) grid.
+
+    North/east are ceiled and south/west floored, so the snapped box
+    always *contains* the requested one: nearby viewports still share a
+    cache entry and query plan, but rows at the edge of the client's
+    actual viewport are never cut off by the snap.
+    """
+    # round() before ceil/floor absorbs float artefacts such as
+    # 54.1 * 100 == 5410.000000000001, which would otherwise push the
+    # edge a whole cell outward.
+    return (
+        math.ceil(round(north * 100, 6)) / 100,
+        math.floor(round(south * 100, 6)) / 100,
+        math.ceil(round(east * 100, 6)) / 100,
+        math.floor(round(west * 100, 6)) / 100,
+    )
+
+
+def map_state_key(north: float, south: float, east: float, west: float, **_) -> str:
+    """Key for /api/map/state, bbox snapped outward to the 0.01° grid."""
+    north, south, east, west = snap_bbox_outward(north, south, east, west)
+    return f"map:state:{north}:{south}:{east}:{west}"
+
+
+def departures_key(stop_id: str, **_) -> str:
+    """Key for /api/departures/{stop_id}."""
+    return f"departures:{stop_id}"
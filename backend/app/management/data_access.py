@@ -2,13 +2,27 @@
 LancasterLink – Database Access Layer.
 
 Provides:
-    * SQLAlchemy engine creation and session management.
+    * Async SQLAlchemy engine creation and session management.
     * A ``SessionManager`` singleton used by the FastAPI lifespan handler.
     * A ``get_db`` dependency for injecting DB sessions into route handlers.
+
+All request-path database I/O is asynchronous (asyncpg driver) so queries
+never block the uvicorn event loop; a single worker keeps serving other
+requests while PostgreSQL works.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+import sys
+from contextlib import asynccontextmanager
+
+from sqlalchemy import event, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm.attributes import set_committed_value
 
 
 # ── Declarative Base ─────────────────────────────────────────────────────
@@ -17,15 +31,52 @@ class Base(DeclarativeBase):
     pass
 
 
+def _as_async_url(database_url: str) -> str:
+    """Coerce a database URL onto the asyncpg driver.
+
+    docker-compose supplies a bare ``postgresql://`` URL and older .env
+    files may still name psycopg2 explicitly; both are rewritten so the
+    async engine always gets ``postgresql+asyncpg://``.
+    """
+    if database_url.startswith("postgresql+psycopg2://"):
+        return database_url.replace(
+            "postgresql+psycopg2://", "postgresql+asyncpg://", 1
+        )
+    if database_url.startswith("postgresql://"):
+        return database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return database_url
+
+
+def intern_on_load(model, *fields: str) -> None:
+    """Intern the named string columns whenever ``model`` rows load.
+
+    Codes, modes and operator names repeat across hundreds of thousands
+    of rows; ``sys.intern`` collapses each distinct value to one shared
+    object, cutting resident memory for bulk loads and making the
+    dict/equality work downstream a pointer compare.  Values are set
+    through ``set_committed_value`` so the instance stays clean (no
+    spurious UPDATE on flush, and no write attempt inside READ ONLY
+    transactions).
+    """
+
+    @event.listens_for(model, "load")
+    def _intern(target, _context):
+        state = target.__dict__
+        for name in fields:
+            value = state.get(name)
+            if value is not None:
+                set_committed_value(target, name, sys.intern(value))
+
+
 # ── Session Manager ──────────────────────────────────────────────────────
 class SessionManager:
-    """Thin wrapper around SQLAlchemy engine + sessionmaker.
+    """Thin wrapper around the async SQLAlchemy engine + sessionmaker.
 
     Usage (inside FastAPI lifespan)::
 
         sessionmanager.init(database_url)
         ...
-        sessionmanager.close()
+        await sessionmanager.close()
     """
 
     def __init__(self) -> None:
@@ -33,33 +84,34 @@ class SessionManager:
         self._session_factory = None
 
     def init(self, database_url: str, **engine_kwargs) -> None:
-        """Create the engine and session factory.
+        """Create the async engine and session factory.
 
         Args:
-            database_url: SQLAlchemy database URL.
-            **engine_kwargs: Extra arguments forwarded to ``create_engine``
-                (e.g. ``pool_size``, ``echo``).
+            database_url: SQLAlchemy database URL.  Sync URLs are coerced
+                onto the asyncpg driver automatically.
+            **engine_kwargs: Extra arguments forwarded to
+                ``create_async_engine`` (e.g. ``pool_size``, ``echo``).
         """
-        self._engine = create_engine(
-            database_url,
-            pool_pre_ping=True,
+        engine_kwargs.setdefault("pool_pre_ping", True)
+        self._engine = create_async_engine(
+            _as_async_url(database_url),
             **engine_kwargs,
         )
-        self._session_factory = sessionmaker(
+        self._session_factory = async_sessionmaker(
             bind=self._engine,
             autocommit=False,
             autoflush=False,
             expire_on_commit=False,
         )
 
-    def close(self) -> None:
+    async def close(self) -> None:
         """Dispose of the engine and release all pooled connections."""
         if self._engine is not None:
-            self._engine.dispose()
+            await self._engine.dispose()
             self._engine = None
             self._session_factory = None
 
-    def session(self) -> Session:
+    def session(self) -> AsyncSession:
         """Create a new session.  Caller is responsible for closing it."""
         if self._session_factory is None:
             raise RuntimeError(
@@ -67,6 +119,20 @@ class SessionManager:
             )
         return self._session_factory()
 
+    @asynccontextmanager
+    async def read_session(self):
+        """Session whose transaction is declared READ ONLY to PostgreSQL.
+
+        The request path is read-only (stops, routes, timetable, live
+        positions); telling the server so lets it skip write-set
+        bookkeeping and plan accordingly, and any accidental write in a
+        handler fails loudly instead of silently mutating data.
+        """
+        async with self.session() as db:
+            # Autobegins the transaction and pins it read-only.
+            await db.execute(text("SET TRANSACTION READ ONLY"))
+            yield db
+
     @property
     def engine(self):
         return self._engine
@@ -79,17 +145,131 @@ sessionmanager = SessionManager()
 engine = None  # Access via sessionmanager.engine after init()
 
 
-def get_db():
-    """FastAPI dependency that yields a SQLAlchemy session.
+async def get_db():
+    """FastAPI dependency that yields an async SQLAlchemy session.
 
     Example::
 
         @router.get("/items")
-        def list_items(db: Session = Depends(get_db)):
+        async def list_items(db: AsyncSession = Depends(get_db)):
             ...
     """
-    db = sessionmanager.session()
-    try:
+    async with sessionmanager.session() as db:
         yield db
-    finally:
-        db.close()
+
+
+async def get_read_db():
+    """FastAPI dependency yielding a READ ONLY session.
+
+    Used by the query endpoints (journey, departures, live, map) – see
+    :meth:`SessionManager.read_session`.  Write paths (ingestion,
+    management commands) keep using :func:`get_db`.
+    """
+    async with sessionmanager.read_session() as db:
+        yield db
+
+
+# ── Bulk loading ─────────────────────────────────────────────────────────
+
+async def bulk_copy(db: AsyncSession, table: str, columns, rows) -> int:
+    """Bulk-load rows into a table via PostgreSQL ``COPY``.
+
+    The ingestion feeds (NaPTAN stops, GTFS timetable, live vehicle
+    snapshots) insert tens to hundreds of thousands of rows per run;
+    ``COPY`` streams them in one protocol message instead of paying
+    per-row statement, lock and type-check overhead – one to two
+    orders of magnitude faster than ORM ``add_all``/executemany.
+
+    Args:
+        db: Async session (its transaction carries the COPY).
+        table: Target table name.
+        columns: Column names matching the order of each row tuple.
+        rows: Iterable of tuples of Python values; asyncpg converts
+            them natively, no text encoding round-trip.
+
+    Returns:
+        Number of rows written.
+    """
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    status = await raw.driver_connection.copy_records_to_table(
+        table, records=list(rows), columns=list(columns)
+    )
+    # asyncpg reports the command tag, e.g. "COPY 124536".
+    return int(status.rsplit(" ", 1)[-1])
+
+
+async def upsert_live_vehicles(db: AsyncSession, rows: list[dict]) -> int:
+    """Upsert a polling cycle's vehicle positions in one statement.
+
+    Every ~30 s the pollers deliver a position for each active vehicle;
+    a per-row ``session.merge`` loop would be a SELECT plus an
+    INSERT/UPDATE per vehicle.  ``INSERT .. ON CONFLICT (vehicle_id)
+    DO UPDATE`` lands the whole batch in a single round-trip; ``geom``
+    is a generated column (03-spatial-indexes.sql), so only lat/lon are
+    written and PostGIS keeps it consistent.
+
+    Args:
+        db: Async session (caller commits).
+        rows: Dicts of LiveVehicle column values keyed by column name.
+
+    Returns:
+        Number of rows inserted or updated.
+    """
+    from app.models.live_verhicle import LiveVehicle
+
+    if not rows:
+        return 0
+    stmt = pg_insert(LiveVehicle).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["vehicle_id"],
+        set_={
+            name: stmt.excluded[name]
+            for name in (
+                "route_id",
+                "latitude",
+                "longitude",
+                "bearing",
+                "speed",
+                "transport_mode",
+                "last_updated",
+            )
+        },
+    )
+    result = await db.execute(stmt)
+    return result.rowcount
+
+
+# ── Bulk queries ─────────────────────────────────────────────────────────
+
+async def fetch_timetable_entries(db: AsyncSession):
+    """Fetch all timetable entries, ordered for graph construction.
+
+    The ``ORDER BY (route_id, trip_id, stop_sequence)`` matches the
+    pre-sorted contract of :func:`app.logic.routing.graph_builder.build_graph`,
+    which stream-groups consecutive rows per trip – the database does
+    the sort (with an index) instead of Python.
+
+    Returns plain Core ``Row`` tuples, not ORM instances: the graph
+    build only reads scalar fields from tens of thousands of rows, and
+    skipping identity-map and attribute instrumentation makes the load
+    several times cheaper.  ``Row`` supports attribute access, so
+    ``build_graph`` consumes them unchanged.
+    """
+    from app.models.timetable import TimetableEntry
+
+    result = await db.execute(
+        select(
+            TimetableEntry.route_id,
+            TimetableEntry.trip_id,
+            TimetableEntry.stop_atco_code,
+            TimetableEntry.stop_sequence,
+            TimetableEntry.arrival_time,
+            TimetableEntry.departure_time,
+        ).order_by(
+            TimetableEntry.route_id,
+            TimetableEntry.trip_id,
+            TimetableEntry.stop_sequence,
+        )
+    )
+    return result.all()
@@ -0,0 +1,29 @@
+"""SQLAlchemy ORM model for service disruptions."""
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+
+from app.management.data_access import Base
+
+
+class Disruption(Base):
+    """An active or scheduled service disruption (FR-JP-05).
+
+    Maps to the ``disruptions`` table defined in 02-schema.sql.  A row
+    may target a whole route, a single stop, or both.
+    """
+
+    __tablename__ = "disruptions"
+
+    disruption_id = Column(Integer, primary_key=True, autoincrement=True)
+    route_id = Column(Integer, nullable=True, index=True)
+    stop_atco_code = Column(String(20), nullable=True, index=True)
+    severity = Column(String(20), nullable=False, default="warning")
+    description = Column(Text, nullable=True)
+    starts_at = Column(DateTime, nullable=False)
+    ends_at = Column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<Disruption {self.disruption_id} route={self.route_id} "
+            f"stop={self.stop_atco_code} ({self.severity})>"
+        )
@@ -1,10 +1,10 @@
 """SQLAlchemy ORM model for live vehicle positions."""
 
 from geoalchemy2 import Geometry
-from sqlalchemy import Column, DateTime, Double, Integer, String, ForeignKey, func
+from sqlalchemy import Column, Computed, DateTime, Double, Integer, String, ForeignKey, func
 from sqlalchemy.orm import relationship
 
-from app.management.data_access import Base
+from app.management.data_access import Base, intern_on_load
 
 
 class LiveVehicle(Base):
@@ -25,10 +25,23 @@ class LiveVehicle(Base):
     last_updated = Column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
-    geom = Column(Geometry("POINT", srid=4326), nullable=True)
+    # Generated from lat/lon in the database – see Stop.geom.
+    geom = Column(
+        Geometry("POINT", srid=4326),
+        Computed(
+            "ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)",
+            persisted=True,
+        ),
+        nullable=True,
+    )
 
-    # Relationships
-    route = relationship("Route", back_populates="live_vehicles")
+    # Relationships (lazy="raise" – see Route for rationale).
+    route = relationship(
+        "Route", back_populates="live_vehicles", lazy="raise"
+    )
 
     def __repr__(self) -> str:
         return f"<LiveVehicle {self.vehicle_id} ({self.transport_mode})>"
+
+
+intern_on_load(LiveVehicle, "transport_mode")
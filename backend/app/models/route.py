@@ -4,7 +4,7 @@ from geoalchemy2 import Geometry
 from sqlalchemy import Column, Integer, String
 from sqlalchemy.orm import relationship
 
-from app.management.data_access import Base
+from app.management.data_access import Base, intern_on_load
 
 
 class Route(Base):
@@ -21,13 +21,20 @@ class Route(Base):
     transport_mode = Column(String(20), nullable=False)
     route_geom = Column(Geometry("LINESTRING", srid=4326), nullable=True)
 
-    # Relationships
+    # Relationships.  lazy="raise": nothing on the request path walks
+    # these (the graph build and serialisers read columns directly), so
+    # an accidental lazy access should fail loudly rather than fan out
+    # into per-row SELECTs.  Callers that genuinely need them opt in
+    # with selectinload() on their own query.
     timetable_entries = relationship(
-        "TimetableEntry", back_populates="route", lazy="select"
+        "TimetableEntry", back_populates="route", lazy="raise"
     )
     live_vehicles = relationship(
-        "LiveVehicle", back_populates="route", lazy="select"
+        "LiveVehicle", back_populates="route", lazy="raise"
     )
 
     def __repr__(self) -> str:
         return f"<Route {self.route_id} {self.route_name!r} ({self.transport_mode})>"
+
+
+intern_on_load(Route, "operator", "route_name", "transport_mode")
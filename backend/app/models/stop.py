@@ -1,10 +1,10 @@
 """SQLAlchemy ORM model for NaPTAN stops."""
 
 from geoalchemy2 import Geometry
-from sqlalchemy import Column, Double, String
+from sqlalchemy import Column, Computed, Double, SmallInteger, String, text
 from sqlalchemy.orm import relationship
 
-from app.management.data_access import Base
+from app.management.data_access import Base, intern_on_load
 
 
 class Stop(Base):
@@ -21,13 +21,35 @@ class Stop(Base):
     stop_type = Column(String(20), nullable=False)
     latitude = Column(Double, nullable=False)
     longitude = Column(Double, nullable=False)
-    geom = Column(Geometry("POINT", srid=4326), nullable=True)
-    hub_score = Column(Double, default=0)
+    # Generated in the database from lat/lon (03-spatial-indexes.sql):
+    # ingest writes coordinates only and geom can never drift.
+    geom = Column(
+        Geometry("POINT", srid=4326),
+        Computed(
+            "ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)",
+            persisted=True,
+        ),
+        nullable=True,
+    )
+    # Quantised 0..10000 smallint (05-hub-score-smallint.sql): half the
+    # width of the old double on a column every graph build scans.  The
+    # hub_score property re-exposes the original 0..1 float scale.
+    hub_score_q = Column(
+        "hub_score", SmallInteger, nullable=False, server_default=text("0")
+    )
 
-    # Relationships
+    # Relationships (lazy="raise" – see Route for rationale).
     timetable_entries = relationship(
-        "TimetableEntry", back_populates="stop", lazy="select"
+        "TimetableEntry", back_populates="stop", lazy="raise"
     )
 
+    @property
+    def hub_score(self) -> float:
+        """Hub importance on the 0..1 scale used by the heuristics."""
+        return (self.hub_score_q or 0) / 10000.0
+
     def __repr__(self) -> str:
         return f"<Stop {self.atco_code} {self.name!r}>"
+
+
+intern_on_load(Stop, "atco_code", "locality_code", "stop_type")
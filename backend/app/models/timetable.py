@@ -1,9 +1,32 @@
 """SQLAlchemy ORM model for timetable entries."""
 
-from sqlalchemy import Column, Date, Integer, String, Time, ForeignKey
+from datetime import date
+from functools import lru_cache
+
+from sqlalchemy import Column, Date, Index, Integer, String, Time, ForeignKey, text
 from sqlalchemy.orm import relationship
 
-from app.management.data_access import Base
+from app.management.data_access import Base, intern_on_load
+
+_DAY_CODES = ("Mo", "Tu", "We", "Th", "Fr", "Sa", "Su")
+
+
+@lru_cache(maxsize=128)
+def days_mask(days_of_week) -> int:
+    """Parse a ``days_of_week`` literal ("MoTuWeThFr") into a 7-bit mask.
+
+    Bit ``i`` is set when the service runs on weekday ``i`` (Monday=0,
+    matching :meth:`date.weekday`).  Real feeds use a couple of dozen
+    distinct patterns, so the cache turns thousands of per-entry string
+    parses into dictionary hits; a missing/empty value means daily.
+    """
+    if not days_of_week:
+        return 0b1111111
+    mask = 0
+    for i, code in enumerate(_DAY_CODES):
+        if code in days_of_week:
+            mask |= 1 << i
+    return mask
 
 
 class TimetableEntry(Base):
@@ -13,9 +36,26 @@ class TimetableEntry(Base):
     """
 
     __tablename__ = "timetable"
+    # Mirrors 04-timetable-indexes.sql so metadata create_all() builds
+    # the same indexes on fresh databases.
+    __table_args__ = (
+        Index(
+            "idx_timetable_stop_departure",
+            "stop_atco_code",
+            "departure_time",
+            postgresql_where=text("departure_time IS NOT NULL"),
+        ),
+        Index(
+            "idx_timetable_route_trip_seq",
+            "route_id",
+            "trip_id",
+            "stop_sequence",
+        ),
+    )
 
     timetable_id = Column(Integer, primary_key=True, autoincrement=True)
     route_id = Column(Integer, ForeignKey("routes.route_id"), nullable=False)
+    trip_id = Column(String(50), nullable=True)
     stop_atco_code = Column(
         String(20), ForeignKey("stops.atco_code"), nullable=False
     )
@@ -26,12 +66,35 @@ class TimetableEntry(Base):
     valid_from = Column(Date, nullable=True)
     valid_to = Column(Date, nullable=True)
 
-    # Relationships
-    route = relationship("Route", back_populates="timetable_entries")
-    stop = relationship("Stop", back_populates="timetable_entries")
+    # Relationships (lazy="raise" – see Route for rationale).
+    route = relationship(
+        "Route", back_populates="timetable_entries", lazy="raise"
+    )
+    stop = relationship(
+        "Stop", back_populates="timetable_entries", lazy="raise"
+    )
+
+    def operates_on(self, d: date) -> bool:
+        """True if this entry runs on calendar date ``d``.
+
+        A single bitwise AND against the cached day mask plus the
+        validity window – no per-call string parsing.
+        """
+        if not days_mask(self.days_of_week) & (1 << d.weekday()):
+            return False
+        if self.valid_from is not None and d < self.valid_from:
+            return False
+        if self.valid_to is not None and d > self.valid_to:
+            return False
+        return True
 
     def __repr__(self) -> str:
         return (
             f"<TimetableEntry route={self.route_id} "
             f"stop={self.stop_atco_code} seq={self.stop_sequence}>"
         )
+
+
+intern_on_load(
+    TimetableEntry, "trip_id", "stop_atco_code", "days_of_week"
+)
@@ -1,35 +1,113 @@
 """
 Departure board service – retrieves upcoming departures for a given stop.
 
-Combines timetable data with live delay information.
+The board is produced by a single SQL statement: the timetable rows for
+the stop are filtered, ordered and limited in the database (an index
+scan over ``(stop_atco_code, departure_time)`` – see
+04-timetable-indexes.sql), with the route joined in and each trip's
+final stop name resolved by a correlated subquery.  Fetching the stop's
+whole timetable and filtering in Python would move thousands of rows
+per request for the handful the board shows.
+
+Requirements:
+    FR-DB-01: Show upcoming departures for a stop.
+    FR-DB-02: Show real-time expected times (pending delay feed data).
 """
 
 import logging
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.api.schemas import DepartureBoardResponse, DepartureOut, StopOut
+from app.models.route import Route
+from app.models.stop import Stop
+from app.models.timetable import TimetableEntry
 
 logger = logging.getLogger(__name__)
 
 
-def get_departures(
+async def get_departures(
     stop_id: str,
-    db: Session,
+    db: AsyncSession,
     when: Optional[datetime] = None,
     limit: int = 20,
-):
+) -> DepartureBoardResponse:
     """Return upcoming departures for a stop.
 
     Args:
         stop_id: NaPTAN ATCO code.
-        db: Database session.
+        db: Async database session.
         when: Point in time (defaults to now).
         limit: Maximum number of departures to return.
 
     Returns:
-        DepartureBoardResponse schema (assembled by the route handler).
+        DepartureBoardResponse with up to ``limit`` departures, ordered
+        by scheduled time.
+
+    Raises:
+        HTTPException: 404 if the stop is unknown.
     """
-    # TODO: query timetable + live_vehicles for the stop
-    logger.info("Departure request for stop %s", stop_id)
-    raise NotImplementedError("Departure service not yet implemented.")
+    stop = await db.get(Stop, stop_id)
+    if stop is None:
+        raise HTTPException(status_code=404, detail=f"Unknown stop: {stop_id!r}")
+
+    at = when or datetime.now()
+
+    # Each trip's displayed destination is its final stop's name,
+    # resolved in the same statement rather than per row in Python.
+    final_leg = aliased(TimetableEntry)
+    destination_name = (
+        select(Stop.name)
+        .join(final_leg, final_leg.stop_atco_code == Stop.atco_code)
+        .where(
+            final_leg.route_id == TimetableEntry.route_id,
+            final_leg.trip_id == TimetableEntry.trip_id,
+        )
+        .order_by(final_leg.stop_sequence.desc())
+        .limit(1)
+        .correlate(TimetableEntry)
+        .scalar_subquery()
+    )
+
+    query = (
+        select(
+            TimetableEntry.departure_time,
+            Route.route_name,
+            Route.operator,
+            Route.transport_mode,
+            destination_name.label("destination"),
+        )
+        .join(Route, Route.route_id == TimetableEntry.route_id, isouter=True)
+        .where(
+            TimetableEntry.stop_atco_code == stop_id,
+            TimetableEntry.departure_time.is_not(None),
+            TimetableEntry.departure_time >= at.time(),
+        )
+        .order_by(TimetableEntry.departure_time)
+        .limit(limit)
+    )
+    rows = (await db.execute(query)).all()
+
+    departures = [
+        DepartureOut(
+            route_name=route_name or "",
+            operator=operator or "",
+            destination=destination or route_name or "",
+            scheduled_time=departure_time,
+            # Live delay data is not ingested yet (FR-DB-02); until it
+            # is, expected == scheduled and everything reads on time.
+            expected_time=None,
+            transport_mode=transport_mode or "bus",
+            status="on_time",
+        )
+        for departure_time, route_name, operator, transport_mode, destination
+        in rows
+    ]
+    return DepartureBoardResponse(
+        stop=StopOut.model_validate(stop), departures=departures
+    )
@@ -1,30 +1,267 @@
 """
-Journey planning service – orchestrates stop lookup, graph building,
-and the routing algorithm.
+Journey planning service – orchestrates stop lookup, the shared
+transport graph, and the routing algorithm.
 
-This is the main entry point called by the /api/journey route.
+This is the main entry point called by the /api/journey route.  The
+graph itself is built once at application startup (see ``main.py``
+lifespan) and reused across requests – constructing it takes seconds
+for a city timetable while a single search takes milliseconds, so a
+per-request build would dwarf the query it serves.
 """
 
+import hashlib
 import logging
-from sqlalchemy.orm import Session
+import re
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 
-from app.api.schemas import JourneyRequest
+from fastapi import HTTPException
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.schemas import (
+    JourneyLegOut,
+    JourneyPlanOut,
+    JourneyRequest,
+    JourneyResponse,
+    StopOut,
+)
+from app.logic.disruption_handler import active_disrupted_route_ids
+from app.logic.routing.graph_builder import TransportGraph, build_graph
+from app.logic.spatial_index import StopSpatialIndex
+from app.logic.routing.router import (
+    JourneyPlan,
+    clear_journey_cache,
+    find_journeys_cached,
+)
+from app.management.data_access import fetch_timetable_entries
+from app.models.route import Route
+from app.models.stop import Stop
 
 logger = logging.getLogger(__name__)
 
 
-def plan_journey(request: JourneyRequest, db: Session):
+# ── Graph lifecycle ──────────────────────────────────────────────────────
+
+async def _graph_input_version(db: AsyncSession) -> str:
+    """Cheap fingerprint of the graph's database inputs.
+
+    Row counts and the high-water timetable ID change whenever a feed
+    load touches the tables, and the aggregates are index-answerable –
+    far cheaper than hashing the rows themselves.  Hashed so the value
+    is opaque and fixed-width.
+    """
+    row = (
+        await db.execute(
+            text(
+                "SELECT (SELECT count(*) FROM timetable),"
+                " (SELECT coalesce(max(timetable_id), 0) FROM timetable),"
+                " (SELECT count(*) FROM stops),"
+                " (SELECT count(*) FROM routes)"
+            )
+        )
+    ).one()
+    return hashlib.blake2b(
+        repr(tuple(row)).encode(), digest_size=16
+    ).hexdigest()
+
+
+async def build_graph_from_db(db: AsyncSession) -> TransportGraph:
+    """Load stops, routes and the timetable and build a fresh graph.
+
+    Only the columns the graph and its serialisers read are selected:
+    the PostGIS geometry blobs (stop points, route linestrings) stay in
+    the database instead of being transferred and WKB-parsed for every
+    row of a full-network load.
+    """
+    stops = (
+        await db.execute(
+            select(
+                Stop.atco_code,
+                Stop.name,
+                Stop.stop_type,
+                Stop.latitude,
+                Stop.longitude,
+                (Stop.hub_score_q / 10000.0).label("hub_score"),
+            )
+        )
+    ).all()
+    routes = (
+        await db.execute(
+            select(
+                Route.route_id,
+                Route.route_name,
+                Route.operator,
+                Route.transport_mode,
+            )
+        )
+    ).all()
+    entries = await fetch_timetable_entries(db)
+    graph = build_graph(stops, routes, entries)
+    graph.input_version = await _graph_input_version(db)
+    return graph
+
+
+async def rebuild_graph(application) -> None:
+    """Double-buffered graph refresh for timetable reloads.
+
+    A no-op when the input fingerprint matches the live graph's (a
+    reload that changed nothing should not evict warm plan caches).
+    Otherwise the new graph is built off to the side and swapped in
+    atomically under the graph lock, so in-flight queries never see a
+    half-built structure.
+    """
+    from app.management.data_access import sessionmanager
+
+    async with sessionmanager.session() as db:
+        current = application.state.graph
+        if current is not None:
+            version = await _graph_input_version(db)
+            if version == getattr(current, "input_version", None):
+                logger.info("Graph inputs unchanged; skipping rebuild")
+                return
+        fresh = await build_graph_from_db(db)
+    # Carry the active-disruption marks over before the swap – the fresh
+    # graph is private here, so no lock is needed for the marking itself.
+    disrupted = active_disrupted_route_ids()
+    if disrupted:
+        fresh.mark_disrupted(disrupted)
+    async with application.state.graph_lock:
+        application.state.graph = fresh
+    # Cached plans key on graph identity, so entries for the retired
+    # graph can never be served again – but they would pin the whole old
+    # graph (stops, edges, SoA arrays) in memory until LRU eviction.
+    clear_journey_cache()
+    logger.info("Transport graph hot-swapped (%d stops)", fresh.stop_count)
+
+
+# ── Request handling ─────────────────────────────────────────────────────
+
+# "54.048,-2.801" style origin/destination terms.
+_COORD_RE = re.compile(r"^\s*(-?\d{1,2}(?:\.\d+)?)\s*,\s*(-?\d{1,3}(?:\.\d+)?)\s*$")
+
+# How far a user plausibly walks to their first/last stop.
+_NEAREST_STOP_RADIUS_M = 750.0
+
+
+@lru_cache(maxsize=4)
+def _spatial_index(graph: TransportGraph) -> StopSpatialIndex:
+    """Z-order index over the graph's stops, built once per graph
+    (keyed by identity, so a hot-swapped graph gets a fresh index)."""
+    return StopSpatialIndex.from_stops(
+        stop for stop in (graph.get_stop(a) for a in graph.id_to_atco)
+        if stop is not None
+    )
+
+
+async def _resolve_stop(
+    db: AsyncSession, term: str, graph: TransportGraph | None = None
+):
+    """Resolve an ATCO code, coordinate pair, or search term to a Stop."""
+    match = _COORD_RE.match(term)
+    if match and graph is not None:
+        hits = _spatial_index(graph).nearest(
+            float(match[1]),
+            float(match[2]),
+            radius_m=_NEAREST_STOP_RADIUS_M,
+            max_results=1,
+        )
+        return await db.get(Stop, hits[0][0]) if hits else None
+    stop = await db.get(Stop, term)
+    if stop is not None:
+        return stop
+    result = await db.execute(
+        select(Stop).where(Stop.name.ilike(f"%{term}%")).limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+def _stop_out(stop, atco_fallback: str = "") -> StopOut:
+    """Serialise a stop, degrading gracefully for codes the timetable
+    references but the stop table does not contain."""
+    if stop is not None:
+        return StopOut.model_validate(stop)
+    return StopOut(
+        atco_code=atco_fallback,
+        name=atco_fallback,
+        stop_type="unknown",
+        latitude=0.0,
+        longitude=0.0,
+    )
+
+
+def _combine(on_date: date, t: time, after: datetime) -> datetime:
+    """Anchor a wall-clock time onto a date, rolling past midnight."""
+    stamp = datetime.combine(on_date, t)
+    if stamp < after:
+        stamp += timedelta(days=1)
+    return stamp
+
+
+def _serialise_plan(plan: JourneyPlan, depart_at: datetime) -> JourneyPlanOut:
+    """Convert a router :class:`JourneyPlan` into the API schema."""
+    legs_out: list[JourneyLegOut] = []
+    cursor = depart_at
+    for leg in plan.legs:
+        leg_dep = _combine(cursor.date(), leg.departure_time, cursor)
+        leg_arr = _combine(leg_dep.date(), leg.arrival_time, leg_dep)
+        legs_out.append(
+            JourneyLegOut(
+                mode=leg.mode,
+                route_name=leg.route_name,
+                operator=leg.operator,
+                origin_stop=_stop_out(leg.origin_stop),
+                destination_stop=_stop_out(leg.destination_stop),
+                departure_time=leg_dep,
+                arrival_time=leg_arr,
+                duration_mins=leg.duration_mins,
+                is_walking=leg.is_walking,
+            )
+        )
+        cursor = leg_arr
+    return JourneyPlanOut(
+        legs=legs_out,
+        total_duration_mins=plan.total_duration_mins,
+        total_changes=plan.total_changes,
+        departure_time=legs_out[0].departure_time,
+        arrival_time=legs_out[-1].arrival_time,
+    )
+
+
+async def plan_journey(
+    request: JourneyRequest, db: AsyncSession, graph: TransportGraph
+) -> JourneyResponse:
     """Plan a journey and return ranked options.
 
     Steps (Design Doc §5):
         1. Resolve origin / destination to Stop objects.
-        2. Build the transit graph from timetable data.
-        3. Run the routing algorithm (k-shortest-paths).
-        4. Enrich results with live data / disruptions.
-        5. Return formatted JourneyResponse.
+        2. Run the routing algorithm (k-shortest-paths).
+        3. Return formatted JourneyResponse.
+
+    The graph is read-only here.  Disruption marks (FR-JP-05) are
+    maintained on it by the disruption refresh loop and the hot-swap in
+    :func:`rebuild_graph`, both under ``app.state.graph_lock`` – not per
+    request.
     """
-    # TODO: implement when routing module is merged
-    logger.info(
-        "Journey request: %s -> %s", request.origin, request.destination
+    origin = await _resolve_stop(db, request.origin, graph)
+    destination = await _resolve_stop(db, request.destination, graph)
+    if origin is None or destination is None:
+        missing = request.origin if origin is None else request.destination
+        raise HTTPException(
+            status_code=404, detail=f"Unknown stop: {missing!r}"
+        )
+
+    depart_at = request.depart_at or datetime.now()
+
+    plans = find_journeys_cached(
+        graph,
+        origin.atco_code,
+        destination.atco_code,
+        depart_at.time(),
+        max_results=request.max_results,
+    )
+    return JourneyResponse(
+        journeys=[_serialise_plan(p, depart_at) for p in plans],
+        origin=StopOut.model_validate(origin),
+        destination=StopOut.model_validate(destination),
     )
-    raise NotImplementedError("Journey service not yet implemented.")
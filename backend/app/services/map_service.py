@@ -3,23 +3,60 @@ Map service – supplies combined stop + live vehicle data for the map view.
 """
 
 import logging
-from sqlalchemy.orm import Session
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas import MapBounds
+from app.models.live_verhicle import LiveVehicle
+from app.models.route import Route
+from app.models.stop import Stop
 
 logger = logging.getLogger(__name__)
 
 
-def get_map_state(bounds: MapBounds, db: Session):
+async def get_map_state(bounds: MapBounds, db: AsyncSession):
     """Return stops and live vehicles within the given viewport bounds.
 
     Args:
         bounds: Bounding box from the client.
-        db: Database session.
+        db: Async database session.
 
     Returns:
-        MapStateResponse schema.
+        ``(stops, vehicles)`` – plain column rows; the route handler
+        serialises them in bulk (it never touches individual fields).
+
+    The bbox predicate uses ``geom && ST_MakeEnvelope`` so PostGIS can
+    answer from the GiST index (03-spatial-indexes.sql) instead of
+    scanning latitude/longitude columns.  Only the columns the frontend
+    renders are selected – in particular the geometry blobs stay in the
+    database rather than being decoded per row and thrown away.
     """
-    # TODO: spatial query for stops + live_vehicles within bounds
-    logger.info("Map state request: %s", bounds)
-    raise NotImplementedError("Map service not yet implemented.")
+    envelope = func.ST_MakeEnvelope(
+        bounds.west, bounds.south, bounds.east, bounds.north, 4326
+    )
+    stops_result = await db.execute(
+        select(
+            Stop.atco_code,
+            Stop.name,
+            Stop.stop_type,
+            Stop.latitude,
+            Stop.longitude,
+            (Stop.hub_score_q / 10000.0).label("hub_score"),
+        ).where(Stop.geom.op("&&")(envelope))
+    )
+    vehicles_result = await db.execute(
+        select(
+            LiveVehicle.vehicle_id,
+            Route.route_name,
+            LiveVehicle.latitude,
+            LiveVehicle.longitude,
+            LiveVehicle.bearing,
+            LiveVehicle.speed,
+            LiveVehicle.transport_mode,
+            LiveVehicle.last_updated,
+        )
+        .join(Route, Route.route_id == LiveVehicle.route_id, isouter=True)
+        .where(LiveVehicle.geom.op("&&")(envelope))
+    )
+    return stops_result.all(), vehicles_result.all()
@@ -7,6 +7,22 @@ or are reflected in API responses.
 
 import re
 
+# Compiled once at import: these run per request (every ATCO code and
+# search term passes through), and skipping re's cache lookup keeps the
+# match itself the only per-call work.
+_CTRL_RE = re.compile(r"[\x00-\x1f\x7f]")
+_SQL_RE = re.compile(r"(--|;|/\*|\*/|')")
+_ATCO_RE = re.compile(r"[^A-Za-z0-9]")
+
+# ATCO codes are short, regular and ASCII: a translate() table that
+# deletes every non-alphanumeric character beats a regex scan; the
+# regex remains as the fallback for (malformed) non-ASCII input.
+_NON_ALNUM_TABLE = {
+    cp: None
+    for cp in range(128)
+    if not chr(cp).isalnum()
+}
+
 
 def sanitise_string(value: str, max_length: int = 255) -> str:
     """Strip dangerous characters and enforce a length limit.
@@ -19,7 +35,7 @@ def sanitise_string(value: str, max_length: int = 255) -> str:
         Cleaned string.
     """
     # Remove control characters (except space)
-    cleaned = re.sub(r"[\x00-\x1f\x7f]", "", value)
+    cleaned = _CTRL_RE.sub("", value)
     # Collapse whitespace
     cleaned = " ".join(cleaned.split())
     return cleaned[:max_length]
@@ -30,7 +46,10 @@ def sanitise_atco_code(code: str) -> str:
 
     ATCO codes are alphanumeric, typically 12 characters.
     """
-    cleaned = re.sub(r"[^A-Za-z0-9]", "", code)
+    if code.isascii():
+        cleaned = code.translate(_NON_ALNUM_TABLE)
+    else:
+        cleaned = _ATCO_RE.sub("", code)
     if not cleaned:
         raise ValueError("Invalid ATCO code: empty after sanitisation.")
     return cleaned[:20]
@@ -44,5 +63,5 @@ def sanitise_search_term(term: str, max_length: int = 100) -> str:
     """
     cleaned = sanitise_string(term, max_length)
     # Remove SQL-injection-style patterns (belt-and-braces)
-    cleaned = re.sub(r"(--|;|/\*|\*/|')", "", cleaned)
+    cleaned = _SQL_RE.sub("", cleaned)
     return cleaned
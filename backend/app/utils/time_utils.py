@@ -2,7 +2,7 @@
 Time-related utility functions used across the backend.
 """
 
-from datetime import datetime, time, timedelta, timezone
+from datetime import datetime, time, timezone
 
 # Lancaster sits in the UK timezone (GMT / BST).  For simplicity we
 # default to UTC internally and only localise for display.
@@ -20,18 +20,23 @@ def time_diff_minutes(t1: time, t2: time) -> float:
     Assumes both are on the same day.  If t2 < t1, assumes t2 is the
     next day (wraps past midnight).
     """
-    d1 = timedelta(hours=t1.hour, minutes=t1.minute, seconds=t1.second)
-    d2 = timedelta(hours=t2.hour, minutes=t2.minute, seconds=t2.second)
-    diff = d2 - d1
-    if diff.total_seconds() < 0:
-        diff += timedelta(days=1)
-    return diff.total_seconds() / 60.0
+    s1 = t1.hour * 3600 + t1.minute * 60 + t1.second
+    s2 = t2.hour * 3600 + t2.minute * 60 + t2.second
+    return ((s2 - s1) % 86400) / 60.0
 
 
 def add_minutes_to_time(t: time, minutes: float) -> time:
-    """Add ``minutes`` to a ``time`` object, wrapping past midnight."""
-    dt = datetime.combine(datetime.min, t) + timedelta(minutes=minutes)
-    return dt.time()
+    """Add ``minutes`` to a ``time`` object, wrapping past midnight.
+
+    Pure integer seconds arithmetic – no datetime/timedelta allocation
+    per call (this helper is used per leg when formatting plans).
+    """
+    total = (
+        t.hour * 3600 + t.minute * 60 + t.second + int(minutes * 60)
+    ) % 86400
+    hours, rem = divmod(total, 3600)
+    mins, secs = divmod(rem, 60)
+    return time(hours, mins, secs)
 
 
 def iso_format(dt: datetime) -> str:
@@ -0,0 +1,28 @@
+-- ============================================================
+-- LancasterLink – Spatial indexes for viewport queries.
+--
+-- The /api/live and /api/map endpoints filter stops and vehicles by a
+-- bounding box on every map pan and poll cycle.  A plain
+-- latitude/longitude BETWEEN predicate is a full-table scan; a GiST
+-- index over a generated geometry column makes it an O(log n + k)
+-- index lookup via the && (bbox overlap) operator.
+--
+-- The geom columns are GENERATED so the ingestion pipeline only ever
+-- writes latitude/longitude and can never leave geom out of sync.
+-- ============================================================
+
+ALTER TABLE stops
+    DROP COLUMN IF EXISTS geom,
+    ADD COLUMN geom geometry(Point, 4326)
+        GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_stops_geom
+    ON stops USING GIST (geom);
+
+ALTER TABLE live_vehicles
+    DROP COLUMN IF EXISTS geom,
+    ADD COLUMN geom geometry(Point, 4326)
+        GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_live_vehicles_geom
+    ON live_vehicles USING GIST (geom);
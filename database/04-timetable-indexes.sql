@@ -0,0 +1,22 @@
+-- ============================================================
+-- LancasterLink – Timetable indexes for the hot query paths.
+--
+-- The departure board filters by stop and scheduled time and takes the
+-- first N rows; the composite index lets the planner walk
+-- (stop_atco_code, departure_time) in order and stop at the LIMIT
+-- instead of scanning and sorting the stop's whole timetable.
+--
+-- The departure index is partial: rows without a departure time are
+-- never shown on a board, so they need not take up index pages.
+--
+-- The graph build streams the entire timetable ordered by
+-- (route_id, trip_id, stop_sequence); the second index hands the
+-- database that order for free.
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS idx_timetable_stop_departure
+    ON timetable (stop_atco_code, departure_time)
+    WHERE departure_time IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_timetable_route_trip_seq
+    ON timetable (route_id, trip_id, stop_sequence);
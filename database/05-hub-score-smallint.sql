@@ -0,0 +1,16 @@
+-- ============================================================
+-- LancasterLink – Quantise stops.hub_score to a smallint.
+--
+-- hub_score is a bounded 0..1 priority used for tie-breaking; a
+-- float8 spends 8 bytes on it.  Storing it as 0..10000 smallint
+-- halves the column and keeps more of the stops table in cache for
+-- the sequential scans the graph build performs.  The ORM re-exposes
+-- the 0..1 float scale (Stop.hub_score property), so nothing
+-- downstream changes.
+-- ============================================================
+
+ALTER TABLE stops
+    ALTER COLUMN hub_score TYPE smallint
+        USING (round(COALESCE(hub_score, 0) * 10000))::smallint,
+    ALTER COLUMN hub_score SET DEFAULT 0,
+    ALTER COLUMN hub_score SET NOT NULL;
@@ -0,0 +1,11 @@
+"""Pytest configuration – make the backend package importable.
+
+The backend app lives under ``backend/`` (imported as ``app.*`` inside
+the Docker image, where ``backend/`` is the working directory).  Tests
+run from the repo root, so add ``backend/`` to ``sys.path`` here.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
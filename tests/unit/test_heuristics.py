@@ -0,0 +1,40 @@
+import numpy as np
+
+from app.logic import reliability
+from app.logic.routing import heuristics
+
+
+def test_hub_bonus_is_capped_and_negative():
+    assert heuristics.hub_bonus(0.0) == 0.0
+    assert heuristics.hub_bonus(1.0) == -heuristics.HUB_MAX_BONUS_MINS
+    # Scores above the normalisation constant do not over-reward
+    assert heuristics.hub_bonus(5.0, hub_score_max=1.0) == -heuristics.HUB_MAX_BONUS_MINS
+
+
+def test_delay_penalty_is_clipped():
+    assert heuristics.delay_penalty(0.0, 0.0) == 0.0
+    assert heuristics.delay_penalty(1.0, 1.0) == heuristics.DELAY_MAX_PENALTY_MINS
+    assert heuristics.delay_penalty(2.0, 2.0) == heuristics.DELAY_MAX_PENALTY_MINS
+
+
+def test_fragile_connection_thresholds():
+    # A 1-minute rail transfer is fragile; a 15-minute one is not.
+    assert heuristics.is_fragile_connection(1.0, "rail")
+    assert not heuristics.is_fragile_connection(15.0, "rail")
+
+
+def test_vectorised_reliability_matches_scalar():
+    transfers = np.array([1.0, 3.0, 6.0, 10.0, 20.0])
+    modes = ["rail", "bus", "tram", "rail", "bus"]
+    hubs = np.array([0.0, 0.5, 1.0, 2.0, 0.0])
+
+    vector = reliability.connection_reliability_scores(
+        transfers,
+        np.array([reliability.mode_code(m) for m in modes]),
+        hubs,
+    )
+    scalar = [
+        reliability.connection_reliability_score(t, m, h)
+        for t, m, h in zip(transfers, modes, hubs)
+    ]
+    assert np.allclose(vector, scalar)
@@ -0,0 +1,109 @@
+from datetime import time
+from types import SimpleNamespace
+
+from app.logic.routing.graph_builder import build_graph
+
+
+def _stop(atco, name="Stop"):
+    return SimpleNamespace(atco_code=atco, name=name, hub_score=0.0)
+
+
+def _route(route_id):
+    return SimpleNamespace(route_id=route_id)
+
+
+def _entry(route_id, trip_id, atco, seq, dep, arr=None):
+    return SimpleNamespace(
+        route_id=route_id,
+        trip_id=trip_id,
+        stop_atco_code=atco,
+        stop_sequence=seq,
+        departure_time=dep,
+        arrival_time=arr or dep,
+    )
+
+
+def _small_graph():
+    stops = [_stop("A"), _stop("B"), _stop("C")]
+    routes = [_route(1)]
+    entries = [
+        # trip t1: A 09:00 -> B 09:10 -> C 09:25
+        _entry(1, "t1", "A", 1, time(9, 0)),
+        _entry(1, "t1", "B", 2, time(9, 10)),
+        _entry(1, "t1", "C", 3, time(9, 25)),
+        # trip t2: A 10:00 -> B 10:10
+        _entry(1, "t2", "A", 1, time(10, 0)),
+        _entry(1, "t2", "B", 2, time(10, 10)),
+    ]
+    walking = [("B", "C", 12.0, 900.0)]
+    return build_graph(stops, routes, entries, walking)
+
+
+def test_build_graph_creates_edges_per_trip():
+    graph = _small_graph()
+    assert graph.stop_count == 3
+    # t1 contributes A->B and B->C; t2 contributes A->B
+    assert graph.transit_edge_count == 3
+
+
+def test_travel_minutes_precomputed():
+    graph = _small_graph()
+    edges = graph.get_outgoing_transit_edges("A", 0)
+    assert [e.travel_minutes for e in edges] == [10.0, 10.0]
+    assert [e.departure_min for e in edges] == [9 * 60, 10 * 60]
+
+
+def test_outgoing_edges_respect_earliest_departure():
+    graph = _small_graph()
+    edges = graph.get_outgoing_transit_edges("A", 9 * 60 + 30)
+    assert len(edges) == 1
+    assert edges[0].departure_time == time(10, 0)
+
+
+def test_disrupted_routes_are_excluded():
+    graph = _small_graph()
+    graph.mark_disrupted([1])
+    assert graph.get_outgoing_transit_edges("A", 0) == []
+    graph.clear_disruptions()
+    assert len(graph.get_outgoing_transit_edges("A", 0)) == 2
+
+
+def test_walking_edges_are_bidirectional():
+    graph = _small_graph()
+    assert [e.to_stop for e in graph.get_walking_edges("B")] == ["C"]
+    assert [e.to_stop for e in graph.get_walking_edges("C")] == ["B"]
+
+
+def test_find_journeys_prefers_fastest_arrival():
+    from app.logic.routing.router import find_journeys
+
+    graph = _small_graph()
+    plans = find_journeys(graph, "A", "C", time(8, 50), max_results=2)
+    assert plans
+    best = plans[0]
+    # Ride A->B on t1 (arrive 09:10), walk to C (12 min) -> 09:22,
+    # beating staying on t1 to C (09:25).
+    assert best.arrival_time == time(9, 22)
+    assert best.legs[0].is_walking is False
+    assert best.legs[-1].is_walking is True
+    assert best.total_changes == 0
+
+
+def test_find_journeys_unreachable_returns_empty():
+    from app.logic.routing.router import find_journeys
+
+    graph = _small_graph()
+    assert find_journeys(graph, "C", "A", time(9, 0)) == []
+
+
+def test_python_search_matches_public_result():
+    from app.logic.routing import router
+
+    graph = _small_graph()
+    dep_min = 8 * 60 + 50
+    predecessors, dest_cost = router._dijkstra_search(graph, "A", "C", dep_min)
+    path = router._trace_python(predecessors, "A", "C")
+    plan = router._reconstruct(graph, path, dep_min)
+    public = router.find_journeys(graph, "A", "C", time(8, 50), max_results=1)[0]
+    assert plan.arrival_time == public.arrival_time
+    assert plan.total_duration_mins == public.total_duration_mins
@@ -0,0 +1,51 @@
+"""Unit tests for the z-order stop index (app.logic.spatial_index)."""
+
+from types import SimpleNamespace
+
+from app.logic.spatial_index import StopSpatialIndex
+
+
+def _stop(atco, lat, lon):
+    return SimpleNamespace(atco_code=atco, latitude=lat, longitude=lon)
+
+
+def _lancaster_index():
+    # Rough real-world layout: station, bus station, university, Morecambe.
+    return StopSpatialIndex.from_stops(
+        [
+            _stop("STATION", 54.0484, -2.8077),
+            _stop("BUSSTN", 54.0490, -2.8010),
+            _stop("UNI", 54.0104, -2.7877),
+            _stop("MORECAMBE", 54.0730, -2.8700),
+        ]
+    )
+
+
+def test_nearest_orders_by_distance():
+    index = _lancaster_index()
+    hits = index.nearest(54.0486, -2.8060, radius_m=1000.0)
+    assert [atco for atco, _ in hits] == ["STATION", "BUSSTN"]
+    assert hits[0][1] < hits[1][1]
+
+
+def test_nearest_respects_radius_and_max_results():
+    index = _lancaster_index()
+    # 200 m around the station excludes the bus station (~450 m away).
+    hits = index.nearest(54.0484, -2.8077, radius_m=200.0)
+    assert [atco for atco, _ in hits] == ["STATION"]
+    assert index.nearest(54.0486, -2.8060, radius_m=20000.0, max_results=2)[
+        0
+    ][0] == "STATION"
+
+
+def test_stops_without_coordinates_are_skipped():
+    index = StopSpatialIndex.from_stops(
+        [_stop("OK", 54.0, -2.8), _stop("NOCOORD", None, None)]
+    )
+    assert len(index) == 1
+    assert index.nearest(54.0, -2.8, radius_m=100.0)[0][0] == "OK"
+
+
+def test_empty_index_returns_no_hits():
+    index = StopSpatialIndex.from_stops([])
+    assert index.nearest(54.0, -2.8) == []